@@ -11,19 +11,29 @@ import sys
 os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'
 os.environ['FLAGS_use_mkldnn'] = '1'
 
+import asyncio
+import atexit
+import base64
+import hashlib
+import itertools
+import re
 import tempfile
+import time
 import shutil
 import uuid
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
 from datetime import datetime
 
+import cv2
+import numpy as np
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
 # 상위 디렉토리의 모듈 import를 위해 경로 추가
@@ -39,21 +49,123 @@ from dcas_client import (
 )
 from parallel_ocr import ParallelOCRProcessor, BatchOCRResult, job_manager
 
+# RE2(DFA) 엔진이 설치되어 있으면 방사선량 추출에 사용 (선택사항)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# libjpeg-turbo(SIMD) JPEG 인코더 (선택사항 - 없으면 OpenCV 사용)
+try:
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    # 패키지 미설치 또는 libjpeg-turbo 공유 라이브러리를 찾지 못한 경우
+    _turbo_jpeg = None
+
 # OCR 프로세서 인스턴스 (전역 싱글톤 - 스레드 안전)
 _global_ocr_processor: Optional[OCRProcessor] = None
 _ocr_processor_lock = threading.Lock()
 _ocr_initialized = False
 
-# Dcas 클라이언트 세션 관리
+# Dcas 클라이언트 세션 관리 (읽기는 락 없이, 쓰기는 복사 후 교체)
 dcas_sessions: Dict[str, DcasClient] = {}
 dcas_sessions_lock = threading.Lock()
 
-# 검사 정보 캐시 (cine_no -> study_info)
-study_info_cache: Dict[str, Any] = {}
-study_info_cache_lock = threading.Lock()
+
+
+class SnapshotCache:
+    """
+    읽기 위주 TTL 캐시 (copy-on-write)
+    
+    읽기는 현재 dict 스냅샷을 락 없이 조회하고 (CPython dict 조회는 원자적),
+    쓰기는 락 안에서 복사본을 수정한 뒤 참조를 교체합니다.
+    """
+    
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: Dict[Any, Any] = {}
+        self._write_lock = threading.Lock()
+    
+    def get(self, key):
+        """TTL이 지나지 않은 캐시 값을 반환합니다 (없거나 만료되면 None)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            return None
+        return value
+    
+    def put(self, key, value):
+        """캐시에 값을 저장합니다. 최대 크기를 넘으면 가장 오래된 항목부터 제거합니다."""
+        with self._write_lock:
+            data = dict(self._data)
+            data.pop(key, None)
+            data[key] = (time.monotonic(), value)
+            while len(data) > self.max_size:
+                # dict는 삽입 순서를 유지하므로 첫 키가 가장 오래된 항목
+                del data[next(iter(data))]
+            self._data = data
+
+
+# 미리보기 JPEG 캐시 (URL 해시 -> jpeg_bytes)
+PREVIEW_CACHE_TTL = 600  # 초
+PREVIEW_CACHE_MAX_SIZE = 256
+preview_cache = SnapshotCache(PREVIEW_CACHE_TTL, PREVIEW_CACHE_MAX_SIZE)
 
 # 지원하는 파일 확장자
-SUPPORTED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.webp', '.pdf'}
+SUPPORTED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.webp', '.pdf'})
+
+# PDF 업로드를 임시 파일로 복사할 때의 청크 크기 (1 MiB)
+UPLOAD_COPY_CHUNK_SIZE = 1 << 20
+
+# PDF 업로드용 임시 디렉토리 링 (요청마다 mkdtemp/rmtree 하지 않고 재사용)
+SCRATCH_RING_SIZE = 8
+_scratch_dirs: List[Path] = []
+_scratch_cycle = None
+_scratch_lock = threading.Lock()
+
+# PaddleOCR 고성능 추론(enable_hpi) 사용 여부 (OCR_ENABLE_HPI=0 으로 비활성화)
+OCR_ENABLE_HPI = os.getenv("OCR_ENABLE_HPI", "1").lower() not in ("0", "false", "no")
+
+# 추론 장치/정밀도 (예: OCR_DEVICE=gpu OCR_PRECISION=fp16)
+# 기본값 auto: CUDA 장치가 보이면 gpu:0, 없으면 cpu (빈 값이면 엔진 기본값)
+OCR_DEVICE = os.getenv("OCR_DEVICE", "auto") or None
+OCR_PRECISION = os.getenv("OCR_PRECISION") or None
+OCR_USE_TENSORRT = os.getenv("OCR_USE_TENSORRT", "0").lower() in ("1", "true", "yes")
+
+# CPU 추론 스레드 수 (기본값: 논리 코어의 절반, 하이퍼스레딩 환경에서 물리 코어 수에 해당)
+OCR_CPU_THREADS = int(os.getenv("OCR_CPU_THREADS", max(1, (os.cpu_count() or 2) // 2)))
+
+# CPU에서 MKL-DNN(oneDNN) 사용 여부 (미지정 시 엔진 기본값)
+OCR_ENABLE_MKLDNN = (
+    os.environ["OCR_ENABLE_MKLDNN"].lower() not in ("0", "false", "no")
+    if os.getenv("OCR_ENABLE_MKLDNN") else None
+)
+
+# 엔진 초기화 직후 더미 추론으로 첫 요청 지연 제거 (OCR_WARMUP=0 으로 비활성화)
+OCR_WARMUP = os.getenv("OCR_WARMUP", "1").lower() not in ("0", "false", "no")
+
+# 배치 크기 메모리 프로필 (low/throughput, get_ocr_processor 참고)
+OCR_MEMORY_PROFILE = os.getenv("OCR_MEMORY_PROFILE", "low") or None
+
+# 텍스트 인식 배치 크기 (지정 시 프로필보다 우선)
+OCR_REC_BATCH_NUM = int(os.environ["OCR_REC_BATCH_NUM"]) if os.getenv("OCR_REC_BATCH_NUM") else None
+
+# 일괄 처리 시 OCR 전 리포트 이미지 긴 변의 최대 픽셀 수 (0이면 원본 크기)
+OCR_MAX_IMAGE_SIZE = int(os.getenv("OCR_MAX_IMAGE_SIZE", "1600")) or None
+
+# 단건 OCR 요청용 스레드 풀 (이벤트 루프 블로킹 방지)
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", os.cpu_count() or 1))
+_ocr_pool = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix="OCR-API")
+
+# 작업 목록/결과 조회 시 한 페이지의 최대 항목 수
+MAX_PAGE_SIZE = 500
+
+# 배치 OCR 작업당 보관할 최대 결과 수 (초과 시 오래된 결과부터 제거)
+job_manager.max_results = int(os.getenv("OCR_JOB_MAX_RESULTS", "10000"))
 
 
 @asynccontextmanager
@@ -62,6 +174,9 @@ async def lifespan(app: FastAPI):
     # Startup
     print("[START] PaddleOCR API Server starting...")
     
+    # PDF 업로드용 임시 디렉토리 준비
+    init_scratch_dirs()
+    
     # OCR 엔진 미리 초기화 (워밍업)
     warmup_ocr("korean")
     
@@ -72,14 +187,18 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("[STOP] Server shutting down...")
+    _ocr_pool.shutdown(wait=False)
+    cleanup_scratch_dirs()
     # Dcas 세션 정리
+    global dcas_sessions
     with dcas_sessions_lock:
-        for session_id, client in dcas_sessions.items():
-            try:
-                client.logout()
-            except:
-                pass
-        dcas_sessions.clear()
+        clients = list(dcas_sessions.values())
+        dcas_sessions = {}
+    for client in clients:
+        try:
+            client.logout()
+        except:
+            pass
 
 
 # FastAPI 앱 생성
@@ -87,7 +206,8 @@ app = FastAPI(
     title="PaddleOCR API",
     description="PaddleOCR 기반 이미지 텍스트 추출 API (Dcas 연동)",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson으로 JSON 직렬화 (stdlib json보다 빠름)
 )
 
 # CORS 설정 (React 개발 서버 허용)
@@ -134,6 +254,7 @@ class PatientListRequest(BaseModel):
     end_date: Optional[str] = None
     patient_id: str = ""
     patient_name: str = ""
+    refresh: bool = False  # True면 캐시를 무시하고 다시 조회
 
 
 class PatientItem(BaseModel):
@@ -206,13 +327,37 @@ class ExtractDataResponse(BaseModel):
 # ============= 헬퍼 함수 =============
 
 def get_ocr_processor(lang: str = "korean") -> OCRProcessor:
-    """OCR 프로세서 인스턴스를 가져옵니다 (전역 싱글톤)."""
+    """
+    OCR 프로세서 인스턴스를 가져옵니다 (전역 싱글톤).
+    
+    배치 크기는 OCR_MEMORY_PROFILE(기본값 "low", 인식/방향 분류 배치 1)을 사용합니다.
+    Paddle 추론 엔진은 배치 크기에 비례해 메모리 아레나를 미리 할당하므로,
+    이미지를 한 장씩 처리하는 이 서버에서는 배치 1로 두어 상주 메모리를 줄입니다.
+    한 이미지의 텍스트 줄이 많아 인식 속도가 더 중요하면 "throughput"으로 바꾸거나
+    OCR_REC_BATCH_NUM으로 인식 배치 크기를 직접 지정하세요.
+    """
     global _global_ocr_processor, _ocr_initialized
     
+    # 빠른 경로: 이미 같은 언어로 생성되어 있으면 락 없이 반환
+    processor = _global_ocr_processor
+    if processor is not None and processor.lang == lang:
+        return processor
+    
     with _ocr_processor_lock:
         if _global_ocr_processor is None or _global_ocr_processor.lang != lang:
             print(f"[INIT] OCR processor initializing... (lang: {lang})")
-            _global_ocr_processor = OCRProcessor(lang=lang)
+            _global_ocr_processor = OCRProcessor(
+                lang=lang,
+                enable_hpi=OCR_ENABLE_HPI,
+                rec_batch_num=OCR_REC_BATCH_NUM,
+                memory_profile=OCR_MEMORY_PROFILE,
+                warmup=OCR_WARMUP,
+                cpu_threads=OCR_CPU_THREADS,
+                enable_mkldnn=OCR_ENABLE_MKLDNN,
+                device=OCR_DEVICE,
+                precision=OCR_PRECISION,
+                use_tensorrt=OCR_USE_TENSORRT
+            )
         return _global_ocr_processor
 
 
@@ -227,27 +372,79 @@ def warmup_ocr(lang: str = "korean"):
     try:
         processor = get_ocr_processor(lang)
         # 엔진 초기화 강제 실행
-        processor._initialize_ocr()
+        processor.ensure_initialized()
         _ocr_initialized = True
         print("[OK] OCR engine initialized!")
     except Exception as e:
         print(f"[WARN] OCR warmup failed: {e}")
 
 
+def init_scratch_dirs():
+    """PDF 업로드용 임시 디렉토리 링을 생성합니다 (이미 있으면 무시)."""
+    global _scratch_cycle
+    
+    with _scratch_lock:
+        if _scratch_dirs:
+            return
+        _scratch_dirs.extend(
+            Path(tempfile.mkdtemp(prefix="ocr-")) for _ in range(SCRATCH_RING_SIZE)
+        )
+        _scratch_cycle = itertools.cycle(_scratch_dirs)
+
+
+def cleanup_scratch_dirs():
+    """임시 디렉토리 링을 삭제합니다."""
+    global _scratch_cycle
+    
+    with _scratch_lock:
+        for scratch_dir in _scratch_dirs:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+        _scratch_dirs.clear()
+        _scratch_cycle = None
+
+
+def next_scratch_dir() -> Path:
+    """링에서 다음 임시 디렉토리를 반환합니다. (파일명은 호출자가 고유하게 지정)"""
+    if _scratch_cycle is None:
+        init_scratch_dirs()
+    with _scratch_lock:
+        return next(_scratch_cycle)
+
+
+# lifespan 종료 이벤트 없이 프로세스가 끝나는 경우 대비
+atexit.register(cleanup_scratch_dirs)
+
+
 def get_dcas_client(session_id: str) -> Optional[DcasClient]:
-    """세션 ID로 Dcas 클라이언트를 가져옵니다."""
-    with dcas_sessions_lock:
-        return dcas_sessions.get(session_id)
+    """세션 ID로 Dcas 클라이언트를 가져옵니다. (스냅샷 조회 - 락 없음)"""
+    return dcas_sessions.get(session_id)
 
 
 def create_dcas_session(client: DcasClient) -> str:
     """새 Dcas 세션을 생성합니다."""
+    global dcas_sessions
+    
     session_id = str(uuid.uuid4())
     with dcas_sessions_lock:
-        dcas_sessions[session_id] = client
+        sessions = dict(dcas_sessions)
+        sessions[session_id] = client
+        dcas_sessions = sessions
     return session_id
 
 
+def remove_dcas_session(session_id: str) -> Optional[DcasClient]:
+    """Dcas 세션을 제거하고 해당 클라이언트를 반환합니다."""
+    global dcas_sessions
+    
+    with dcas_sessions_lock:
+        if session_id not in dcas_sessions:
+            return None
+        sessions = dict(dcas_sessions)
+        client = sessions.pop(session_id)
+        dcas_sessions = sessions
+    return client
+
+
 # ============= 기본 엔드포인트 =============
 
 @app.get("/")
@@ -294,30 +491,44 @@ async def perform_ocr(
     - **language**: 인식 언어 코드
     """
     # 파일 확장자 확인
-    file_ext = Path(file.filename).suffix.lower() if file.filename else ""
+    file_ext = os.path.splitext(file.filename or "")[1].lower()
     if file_ext not in SUPPORTED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail=f"지원하지 않는 파일 형식입니다: {file_ext}. 지원 형식: {', '.join(SUPPORTED_EXTENSIONS)}"
         )
     
-    # 임시 파일로 저장
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}{file_ext}")
+    temp_file_path = None
+    loop = asyncio.get_running_loop()
     
     try:
-        # 파일 저장
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
         # OCR 프로세서 가져오기
         processor = get_ocr_processor(language)
         
-        # OCR 실행
-        page_results = processor.process_file(
-            temp_file_path,
-            confidence_threshold=confidence_threshold
-        )
+        if file_ext == '.pdf':
+            # PDF는 pdf2image가 파일 경로를 요구하므로 임시 파일로 저장
+            temp_file_path = next_scratch_dir() / f"{uuid.uuid4().hex}{file_ext}"
+            with open(temp_file_path, "wb") as buffer:
+                shutil.copyfileobj(file.file, buffer, UPLOAD_COPY_CHUNK_SIZE)
+            
+            # OCR 실행 (스레드 풀에서 실행)
+            page_results = await loop.run_in_executor(
+                _ocr_pool,
+                lambda: processor.process_file(
+                    str(temp_file_path),
+                    confidence_threshold=confidence_threshold
+                )
+            )
+        else:
+            # 이미지는 디스크를 거치지 않고 메모리에서 바로 디코딩
+            data = await file.read()
+            page_results = await loop.run_in_executor(
+                _ocr_pool,
+                lambda: processor.process_bytes(
+                    data,
+                    confidence_threshold=confidence_threshold
+                )
+            )
         
         # 결과 처리
         all_lines = []
@@ -338,14 +549,17 @@ async def perform_ocr(
         
         result_text = "\n".join(all_text_parts)
         
-        # 통계 계산
+        # 통계 계산 (중간 문자열/리스트를 만들지 않음)
+        confidences = np.fromiter(
+            (line["confidence"] for line in all_lines),
+            dtype=np.float64,
+            count=len(all_lines)
+        )
         statistics = {
             "total_lines": len(all_lines),
-            "total_characters": len(result_text.replace("\n", "").replace(" ", "")),
+            "total_characters": len(result_text) - result_text.count("\n") - result_text.count(" "),
             "pages": len(page_results),
-            "average_confidence": round(
-                sum(line["confidence"] for line in all_lines) / len(all_lines), 4
-            ) if all_lines else 0
+            "average_confidence": round(float(confidences.mean()), 4) if confidences.size else 0
         }
         
         return OCRResponse(
@@ -363,14 +577,30 @@ async def perform_ocr(
         return OCRResponse(success=False, error=f"오류 발생: {str(e)}")
     finally:
         # 임시 파일 정리
-        try:
-            shutil.rmtree(temp_dir)
-        except:
-            pass
+        if temp_file_path:
+            try:
+                os.unlink(temp_file_path)
+            except:
+                pass
 
 
 # ============= Dcas 연동 엔드포인트 =============
 
+@app.get("/api/dcas/health")
+async def dcas_health_check():
+    """Dcas 서버 연결 상태를 확인합니다."""
+    client = DcasClient()
+    try:
+        loop = asyncio.get_running_loop()
+        reachable, latency_ms = await loop.run_in_executor(None, client.check_connection)
+    finally:
+        client.logout()
+    return {
+        "status": "reachable" if reachable else "unreachable",
+        "latency_ms": round(latency_ms, 1)
+    }
+
+
 @app.post("/api/dcas/login", response_model=DcasLoginResponse)
 async def dcas_login(request: DcasLoginRequest):
     """
@@ -411,19 +641,22 @@ async def dcas_login(request: DcasLoginRequest):
 @app.post("/api/dcas/logout")
 async def dcas_logout(session_id: str = Form(...)):
     """Dcas 로그아웃"""
-    with dcas_sessions_lock:
-        client = dcas_sessions.pop(session_id, None)
-        if client:
-            try:
-                client.logout()
-            except:
-                pass
-            return {"success": True, "message": "로그아웃 완료"}
+    client = remove_dcas_session(session_id)
+    if client:
+        try:
+            client.logout()
+        except:
+            pass
+        return {"success": True, "message": "로그아웃 완료"}
     
     return {"success": False, "message": "세션을 찾을 수 없습니다"}
 
 
-@app.post("/api/dcas/patients", response_model=PatientListResponse)
+@app.post(
+    "/api/dcas/patients",
+    response_model=None,
+    responses={200: {"model": PatientListResponse}}
+)
 async def get_patient_list(request: PatientListRequest):
     """
     Dcas에서 환자 리스트를 조회합니다.
@@ -431,6 +664,10 @@ async def get_patient_list(request: PatientListRequest):
     - **modality**: 검사 종류 (기본값: XA)
     - **start_date**: 시작일 (YYYY-MM-DD)
     - **end_date**: 종료일 (YYYY-MM-DD)
+    - **refresh**: True면 캐시를 무시하고 DCAS에서 다시 조회
+    
+    응답 형식은 PatientListResponse와 같지만, 환자 수백 명을 모델로
+    검증/재직렬화하지 않도록 dict를 바로 ORJSONResponse로 반환합니다.
     """
     try:
         # 세션 없이 직접 DCAS 클라이언트 생성
@@ -441,26 +678,29 @@ async def get_patient_list(request: PatientListRequest):
             start_date=request.start_date,
             end_date=request.end_date,
             patient_id=request.patient_id,
-            patient_name=request.patient_name
+            patient_name=request.patient_name,
+            refresh=request.refresh
         )
         
+        # PatientItem 필드와 동일한 dict (읽기 전용 응답이므로 검증 생략)
         patient_items = [
-            PatientItem(
-                cine_no=p.cine_no,
-                patient_id=p.patient_id,
-                patient_name=p.patient_name,
-                gender=p.gender,
-                age=p.age,
-                study_date=p.study_date
-            )
+            {
+                "cine_no": p.cine_no,
+                "patient_id": p.patient_id,
+                "patient_name": p.patient_name,
+                "gender": p.gender,
+                "age": p.age,
+                "study_date": p.study_date
+            }
             for p in patients
         ]
         
-        return PatientListResponse(
-            success=True,
-            patients=patient_items,
-            total=len(patient_items)
-        )
+        return ORJSONResponse({
+            "success": True,
+            "patients": patient_items,
+            "total": len(patient_items),
+            "error": ""
+        })
         
     except DcasAuthError as e:
         return PatientListResponse(success=False, error=str(e))
@@ -474,93 +714,130 @@ class PreviewRequest(BaseModel):
     cine_no: str
     patient_id: str
     image_index: int = -1  # -1이면 마지막 이미지, 0부터 시작
+    include_image: bool = False  # True이면 base64 이미지 데이터 포함 (기본: 메타데이터만)
 
 
 class PreviewResponse(BaseModel):
     success: bool
     image_url: str = ""
-    image_data: str = ""  # base64 encoded
+    image_data: str = ""  # base64 encoded (include_image=True일 때만)
     image_urls: List[str] = []  # 모든 이미지 URL 목록
     current_index: int = 0
     total_images: int = 0
     error: str = ""
 
 
+def _fetch_preview_jpeg(client: DcasClient, target_url: str) -> bytes:
+    """
+    미리보기 이미지를 다운로드하고 리사이즈/압축한 JPEG 바이트를 반환합니다.
+    
+    블로킹 I/O와 이미지 처리를 포함하므로 스레드 풀에서 호출합니다.
+    """
+    # 캐시 확인 (긴 URL 대신 고정 길이 해시를 키로 사용)
+    cache_key = hashlib.blake2b(target_url.encode('utf-8'), digest_size=16).digest()
+    cached = preview_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # 이미지 다운로드
+    t2 = time.time()
+    response = client.session.get(target_url, timeout=30)
+    response.raise_for_status()
+    print(f"⏱️ 이미지 다운로드: {time.time() - t2:.2f}초 ({len(response.content)} bytes)")
+    
+    # 이미지 리사이즈 및 압축 (미리보기 최적화)
+    t3 = time.time()
+    img = cv2.imdecode(np.frombuffer(response.content, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise DcasParseError("미리보기 이미지를 디코딩할 수 없습니다.")
+    
+    # 리사이즈 (최대 800px, 축소에는 INTER_AREA가 빠르고 품질도 좋음)
+    max_size = 800
+    h, w = img.shape[:2]
+    if max(h, w) > max_size:
+        ratio = max_size / max(h, w)
+        img = cv2.resize(img, (int(w * ratio), int(h * ratio)), interpolation=cv2.INTER_AREA)
+    
+    # JPEG 압축 (품질 70%)
+    if _turbo_jpeg is not None:
+        jpeg_bytes = _turbo_jpeg.encode(img, quality=70)
+    else:
+        ok, encoded = cv2.imencode('.jpg', img, [int(cv2.IMWRITE_JPEG_QUALITY), 70])
+        if not ok:
+            raise DcasParseError("미리보기 이미지 인코딩에 실패했습니다.")
+        jpeg_bytes = encoded.tobytes()
+    print(f"⏱️ 이미지 최적화: {time.time() - t3:.2f}초 ({len(jpeg_bytes)} bytes)")
+    
+    preview_cache.put(cache_key, jpeg_bytes)
+    
+    return jpeg_bytes
+
+
+def _resolve_preview_target(client: DcasClient, cine_no: str, patient_id: str, image_index: int):
+    """
+    검사 정보를 조회하고 미리보기 대상 이미지 인덱스와 URL을 결정합니다.
+    
+    Returns:
+        Tuple[StudyInfo, int, str]: (검사 정보, 이미지 인덱스, 이미지 URL)
+    
+    Raises:
+        DcasParseError: 이미지를 찾을 수 없을 때
+    """
+    # 검사 정보 조회 (DcasClient 응답 캐시 사용)
+    patient = PatientInfo(cine_no=cine_no, patient_id=patient_id)
+    t1 = time.time()
+    study_info = client.get_study_info(patient)
+    print(f"⏱️ 검사 정보 조회: {time.time() - t1:.2f}초")
+    
+    if not study_info.image_urls:
+        raise DcasParseError("이미지를 찾을 수 없습니다.")
+    
+    # 이미지 인덱스 결정 (-1이면 마지막)
+    if image_index < 0:
+        image_index = len(study_info.image_urls) - 1
+    elif image_index >= len(study_info.image_urls):
+        image_index = len(study_info.image_urls) - 1
+    
+    return study_info, image_index, study_info.image_urls[image_index]
+
+
 @app.post("/api/dcas/preview", response_model=PreviewResponse)
 async def get_patient_preview(request: PreviewRequest):
     """
-    환자의 리포트 이미지 미리보기를 가져옵니다.
+    환자의 리포트 이미지 미리보기 메타데이터를 가져옵니다.
+    
+    이미지 자체는 `/api/dcas/preview/image`에서 JPEG로 직접 받습니다.
     
     - **cine_no**: 검사 번호
     - **patient_id**: 환자 ID
     - **image_index**: 이미지 인덱스 (-1이면 마지막 이미지)
+    - **include_image**: base64 이미지 데이터 포함 여부 (기본값: False)
     """
-    import base64
-    from io import BytesIO
-    from PIL import Image
-    import time
-    
     start_time = time.time()
+    loop = asyncio.get_running_loop()
     
     try:
         # DCAS 클라이언트 생성
         client = DcasClient()
         
-        # 환자 정보 생성
-        patient = PatientInfo(cine_no=request.cine_no, patient_id=request.patient_id)
-        
-        # 검사 정보 조회 (이미지 URL 획득)
-        t1 = time.time()
-        study_info = client.get_study_info(patient)
-        print(f"⏱️ 검사 정보 조회: {time.time() - t1:.2f}초")
-        
-        if not study_info.image_urls:
-            return PreviewResponse(success=False, error="이미지를 찾을 수 없습니다.")
-        
-        # 이미지 인덱스 결정 (-1이면 마지막)
-        image_index = request.image_index
-        if image_index < 0:
-            image_index = len(study_info.image_urls) - 1
-        elif image_index >= len(study_info.image_urls):
-            image_index = len(study_info.image_urls) - 1
-        
-        target_url = study_info.image_urls[image_index]
-        
-        # 이미지 다운로드
-        t2 = time.time()
-        response = client.session.get(target_url, timeout=30)
-        response.raise_for_status()
-        print(f"⏱️ 이미지 다운로드: {time.time() - t2:.2f}초 ({len(response.content)} bytes)")
-        
-        # 이미지 리사이즈 및 압축 (미리보기 최적화)
-        t3 = time.time()
-        img = Image.open(BytesIO(response.content))
-        
-        # RGB 변환
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # 리사이즈 (최대 800px)
-        max_size = 800
-        if max(img.size) > max_size:
-            ratio = max_size / max(img.size)
-            new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
-        
-        # JPEG 압축 (품질 70%)
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=70, optimize=True)
-        buffer.seek(0)
-        
-        # base64 인코딩
-        image_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        print(f"⏱️ 이미지 최적화: {time.time() - t3:.2f}초 ({len(buffer.getvalue())} bytes)")
+        study_info, image_index, target_url = await loop.run_in_executor(
+            None,
+            _resolve_preview_target,
+            client, request.cine_no, request.patient_id, request.image_index
+        )
+        
+        image_data = ""
+        if request.include_image:
+            # 이미지 다운로드 및 최적화 (스레드 풀에서 실행)
+            jpeg_bytes = await loop.run_in_executor(None, _fetch_preview_jpeg, client, target_url)
+            image_data = f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('utf-8')}"
+        
         print(f"✅ 총 처리 시간: {time.time() - start_time:.2f}초")
         
         return PreviewResponse(
             success=True,
             image_url=target_url,
-            image_data=f"data:image/jpeg;base64,{image_data}",
+            image_data=image_data,
             image_urls=study_info.image_urls,
             current_index=image_index,
             total_images=len(study_info.image_urls)
@@ -574,6 +851,43 @@ async def get_patient_preview(request: PreviewRequest):
         return PreviewResponse(success=False, error=f"오류 발생: {str(e)}")
 
 
+@app.get("/api/dcas/preview/image")
+async def get_patient_preview_image(cine_no: str, patient_id: str, image_index: int = -1):
+    """
+    환자의 리포트 미리보기 이미지를 JPEG 바이트로 반환합니다.
+    
+    base64 인코딩 없이 전송하므로 <img src>로 바로 사용할 수 있습니다.
+    
+    - **cine_no**: 검사 번호
+    - **patient_id**: 환자 ID
+    - **image_index**: 이미지 인덱스 (-1이면 마지막 이미지)
+    """
+    loop = asyncio.get_running_loop()
+    
+    try:
+        client = DcasClient()
+        
+        _, _, target_url = await loop.run_in_executor(
+            None,
+            _resolve_preview_target,
+            client, cine_no, patient_id, image_index
+        )
+        jpeg_bytes = await loop.run_in_executor(None, _fetch_preview_jpeg, client, target_url)
+    
+    except DcasParseError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except DcasConnectionError as e:
+        raise HTTPException(status_code=502, detail=f"서버 연결 실패: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"오류 발생: {str(e)}")
+    
+    return Response(
+        content=jpeg_bytes,
+        media_type="image/jpeg",
+        headers={"Cache-Control": "private, max-age=300"}
+    )
+
+
 def run_batch_ocr(
     job_id: str,
     client: DcasClient,
@@ -598,7 +912,8 @@ def run_batch_ocr(
             max_workers=max_workers,
             language=language,
             confidence_threshold=confidence_threshold,
-            ocr_processor=ocr_processor  # 전역 프로세서 주입
+            ocr_processor=ocr_processor,  # 전역 프로세서 주입
+            max_image_size=OCR_MAX_IMAGE_SIZE
         )
         
         def on_progress(progress):
@@ -611,22 +926,7 @@ def run_batch_ocr(
         processor.set_progress_callback(on_progress)
         
         def on_complete(result):
-            job = job_manager.get_job(job_id)
-            if job:
-                results = job.get("results", [])
-                results.append(result.to_dict())
-                if result.success:
-                    job_manager.update_job(
-                        job_id,
-                        results=results,
-                        success=job.get("success", 0) + 1
-                    )
-                else:
-                    job_manager.update_job(
-                        job_id,
-                        results=results,
-                        failure=job.get("failure", 0) + 1
-                    )
+            job_manager.add_result(job_id, result.to_dict(), result.success)
         
         batch_result = processor.process_patients(patients, on_complete=on_complete)
         
@@ -719,113 +1019,198 @@ async def get_ocr_status(job_id: str):
 
 
 @app.get("/api/dcas/ocr/jobs")
-async def list_ocr_jobs():
-    """모든 OCR 작업 목록을 조회합니다."""
-    jobs = job_manager.list_jobs()
-    return {"success": True, "jobs": jobs}
-
-
-# ============= 데이터 추출 엔드포인트 =============
+async def list_ocr_jobs(limit: int = 50, offset: int = 0):
+    """
+    OCR 작업 목록을 조회합니다. (결과 제외 요약)
+    
+    - **limit**: 최대 작업 수 (기본값: 50, 최대 500)
+    - **offset**: 건너뛸 작업 수
+    
+    작업별 결과는 /api/dcas/ocr/jobs/{job_id}/results 로 조회합니다.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+    total, jobs = job_manager.list_job_summaries(offset, limit)
+    return {"success": True, "total": total, "offset": offset, "jobs": jobs}
 
-import re
 
-def extract_dose_data(ocr_text: str) -> dict:
+@app.get("/api/dcas/ocr/jobs/{job_id}/results")
+async def get_ocr_job_results(job_id: str, limit: int = 50, offset: int = 0):
     """
-    OCR 텍스트에서 방사선량 데이터를 추출합니다.
+    OCR 작업 결과를 페이지 단위로 조회합니다.
     
-    추출 항목:
-    - DAP: "39.7 Gy·cm2" -> "39700"
-    - AK: "465 mGy" -> "465"
-    - Fluoro Time: "0:15:42" -> "0:15:42"
-    - RUN: "22 Exposure Series 780 Exposure Images" -> "22/780"
-    - ROOM: IRP 15cm 텍스트가 있으면 "2", 없으면 "1"
+    - **limit**: 최대 결과 수 (기본값: 50, 최대 500)
+    - **offset**: 건너뛸 결과 수
     """
-    result = {
-        "dap": "",
-        "ak": "",
-        "fluoro_time": "",
-        "run": "",
-        "room": "1"
-    }
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+    page = job_manager.get_job_results(job_id, offset, limit)
     
+    if page is None:
+        return {"success": False, "error": "작업을 찾을 수 없습니다."}
+    
+    total, results = page
+    return {"success": True, "total": total, "offset": offset, "results": results}
+
+
+# ============= 데이터 추출 엔드포인트 =============
+
+# 방사선량 추출 패턴 (필드별, 우선순위 순)
+# 각 패턴의 첫 번째 캡처 그룹이 추출 값이 됩니다.
+_DOSE_PATTERNS = (
     # DAP 추출 (Total DAP 또는 첫번째 나오는 Gy·cm2 값)
     # 패턴: 숫자.숫자 Gy·cm2 또는 숫자 Gy·cm2 또는 숫자.숫자Gy·cm2
-    dap_patterns = [
+    ("dap", (
         r'Total\s*DAP\s*[\n\r]*\s*([\d.]+)\s*Gy[·\.]?cm2?',  # Total DAP 다음 줄
         r'([\d.]+)\s*Gy[·\.]?cm2?\s*[\n\r]*\s*Total\s*DAP',  # Total DAP 앞에
         r'([\d.]+)\s*Gy[·\.]?cm2?'  # 일반적인 패턴
-    ]
-    
-    for pattern in dap_patterns:
-        match = re.search(pattern, ocr_text, re.IGNORECASE)
-        if match:
-            dap_value = float(match.group(1))
-            # Gy·cm2를 mGy·cm2로 변환 (1000배)
-            result["dap"] = str(int(dap_value * 1000))
-            break
-    
+    )),
     # Air Kerma (AK) 추출
-    ak_patterns = [
+    ("ak", (
         r'([\d.]+)\s*mGy\s*[\n\r]*\s*Total\s*Air\s*Kerma',  # mGy 다음에 Total Air Kerma
         r'Total\s*Air\s*Kerma\s*[\(\[]?K[\)\]]?\*?\s*[\n\r]*\s*([\d.]+)\s*mGy',  # Total Air Kerma 다음
         r'Air\s*Kerma[^\d]*([\d.]+)\s*mGy',  # Air Kerma 근처
         r'([\d.]+)\s*mGy'  # 일반적인 mGy 패턴
-    ]
-    
-    for pattern in ak_patterns:
-        match = re.search(pattern, ocr_text, re.IGNORECASE)
-        if match:
-            result["ak"] = match.group(1).split('.')[0]  # 정수만
-            break
-    
+    )),
     # Fluoro Time 추출 (시:분:초 형식)
-    fluoro_patterns = [
+    ("fluoro_time", (
         r'([\d]{1,2}:[\d]{2}:[\d]{2})\s*[\n\r]*\s*Total\s*Fluoroscopy\s*Time',  # 시간 다음에 Total Fluoroscopy Time
         r'Total\s*Fluoroscopy\s*Time\s*[\n\r]*\s*([\d]{1,2}:[\d]{2}:[\d]{2})',  # Total Fluoroscopy Time 다음
         r'Fluoroscopy\s*Time[^\d]*([\d]{1,2}:[\d]{2}:[\d]{2})',  # Fluoroscopy Time 근처
         r'([\d]{1,2}:[\d]{2}:[\d]{2})'  # 일반적인 시간 패턴
-    ]
-    
-    for pattern in fluoro_patterns:
-        match = re.search(pattern, ocr_text, re.IGNORECASE)
-        if match:
-            result["fluoro_time"] = match.group(1)
-            break
-    
-    # RUN 추출 (Exposure Series / Exposure Images)
-    # 패턴: "22 Exposure Series 780 Exposure Images" -> "22/780"
-    exposure_series = None
-    exposure_images = None
-    
+    )),
     # Exposure Series 추출
-    series_patterns = [
+    ("series", (
         r'([\d]+)\s*[\n\r]*\s*Exposure\s*Series',  # 숫자 다음에 Exposure Series
         r'Exposure\s*Series\s*[\n\r]*\s*([\d]+)',  # Exposure Series 다음
-    ]
-    for pattern in series_patterns:
-        match = re.search(pattern, ocr_text, re.IGNORECASE)
-        if match:
-            exposure_series = match.group(1)
-            break
-    
+    )),
     # Exposure Images 추출
-    images_patterns = [
+    ("images", (
         r'([\d]+)\s*[\n\r]*\s*Exposure\s*Images',  # 숫자 다음에 Exposure Images
         r'Exposure\s*Images\s*[\n\r]*\s*([\d]+)',  # Exposure Images 다음
-    ]
-    for pattern in images_patterns:
-        match = re.search(pattern, ocr_text, re.IGNORECASE)
-        if match:
-            exposure_images = match.group(1)
-            break
+    )),
+    # ROOM 결정용 (Lateral Cumulative Air Kerma 텍스트)
+    ("room", (
+        r'(Lateral\s*Cumulative\s*Air\s*Kerma)',
+    )),
+)
+
+# 첫 번째 캡처 그룹을 "필드_우선순위" 이름의 named group으로 변환
+_CAPTURE_GROUP_RE = re.compile(r'(?<!\\)\((?!\?)')
+
+
+
+def _compile_dose_regex(pattern: str):
+    """
+    대소문자 무시 정규식을 컴파일합니다.
     
+    google-re2가 설치되어 있으면 RE2로 컴파일하고,
+    없거나 RE2가 거부하는 패턴이면 표준 re 모듈을 사용합니다.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(f"(?i){pattern}")
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# 모든 패턴을 하나의 alternation으로 합친 마스터 정규식 (모듈 로드 시 1회 컴파일)
+_DOSE_MASTER_RE = _compile_dose_regex(
+    "|".join(
+        _CAPTURE_GROUP_RE.sub(f"(?P<{key}_{tier}>", pattern, count=1)
+        for key, patterns in _DOSE_PATTERNS
+        for tier, pattern in enumerate(patterns)
+    )
+)
+
+# 필드별 최우선 패턴 그룹 이름 (모두 찾으면 이후 매치는 결과에 영향 없음)
+_DOSE_TOP_TIER_GROUPS = frozenset(f"{key}_0" for key, _ in _DOSE_PATTERNS)
+
+
+def _scan_dose_text(ocr_text: str) -> Dict[str, str]:
+    """
+    마스터 정규식으로 텍스트를 한 번 훑어 패턴별 첫 매치 값을 수집합니다.
+    
+    필드 간 매치가 겹칠 수 있으므로 매치를 소비하지 않고
+    매치 시작 위치 다음 글자부터 다시 검색합니다.
+    (패턴별 결과는 개별 re.search와 동일)
+    모든 필드의 최우선 패턴이 매치되면 남은 텍스트는 검색하지 않습니다.
+    
+    Returns:
+        Dict[str, str]: {"필드_우선순위": 값}
+    """
+    found: Dict[str, str] = {}
+    top_tier_left = len(_DOSE_TOP_TIER_GROUPS)
+    pos = 0
+    match = _DOSE_MASTER_RE.search(ocr_text, pos)
+    while match:
+        name = match.lastgroup
+        if name not in found:
+            found[name] = match.group(name)
+            if name in _DOSE_TOP_TIER_GROUPS:
+                top_tier_left -= 1
+                if top_tier_left == 0:
+                    break
+        pos = match.start() + 1
+        match = _DOSE_MASTER_RE.search(ocr_text, pos)
+    return found
+
+
+def _first_by_priority(found: Dict[str, str], key: str, count: int) -> Optional[str]:
+    """우선순위가 가장 높은 패턴의 매치 값을 반환합니다."""
+    for tier in range(count):
+        value = found.get(f"{key}_{tier}")
+        if value is not None:
+            return value
+    return None
+
+
+def extract_dose_data(ocr_text: str) -> dict:
+    """
+    OCR 텍스트에서 방사선량 데이터를 추출합니다.
+    
+    추출 항목:
+    - DAP: "39.7 Gy·cm2" -> "39700"
+    - AK: "465 mGy" -> "465"
+    - Fluoro Time: "0:15:42" -> "0:15:42"
+    - RUN: "22 Exposure Series 780 Exposure Images" -> "22/780"
+    - ROOM: IRP 15cm 텍스트가 있으면 "2", 없으면 "1"
+    """
+    result = {
+        "dap": "",
+        "ak": "",
+        "fluoro_time": "",
+        "run": "",
+        "room": "1"
+    }
+    
+    found = _scan_dose_text(ocr_text)
+    values = {
+        key: _first_by_priority(found, key, len(patterns))
+        for key, patterns in _DOSE_PATTERNS
+    }
+    
+    # DAP: Gy·cm2를 mGy·cm2로 변환 (1000배)
+    if values["dap"] is not None:
+        result["dap"] = str(int(float(values["dap"]) * 1000))
+    
+    # AK: 정수만
+    if values["ak"] is not None:
+        result["ak"] = values["ak"].split('.')[0]
+    
+    if values["fluoro_time"] is not None:
+        result["fluoro_time"] = values["fluoro_time"]
+    
+    # RUN: "22 Exposure Series 780 Exposure Images" -> "22/780"
+    exposure_series = values["series"]
+    exposure_images = values["images"]
     if exposure_series and exposure_images:
         result["run"] = f"{exposure_series}/{exposure_images}"
     
     # ROOM 결정 (Lateral Cumulative Air Kerma 텍스트 확인)
     # "Lateral Cumulative Air Kerma (K)" 있으면 ROOM = "2", 없으면 ROOM = "1"
-    lateral_pattern = r'Lateral\s*Cumulative\s*Air\s*Kerma'
-    if re.search(lateral_pattern, ocr_text, re.IGNORECASE):
+    if values["room"] is not None:
         result["room"] = "2"
     else:
         result["room"] = "1"
@@ -833,6 +1218,25 @@ def extract_dose_data(ocr_text: str) -> dict:
     return result
 
 
+def _extract_batch(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 OCR 결과에서 방사선량 데이터를 추출합니다. (동기 - 스레드 풀에서 실행)"""
+    extracted_list = []
+    
+    for result in results:
+        ocr_text = result.get("text", "")
+        extracted = extract_dose_data(ocr_text)
+        
+        extracted_list.append({
+            "patient_id": result.get("patient_id", ""),
+            "patient_name": result.get("patient_name", ""),
+            "date": result.get("date", ""),
+            "gender": result.get("gender", ""),
+            **extracted
+        })
+    
+    return extracted_list
+
+
 @app.post("/api/extract", response_model=ExtractDataResponse)
 async def extract_data(request: ExtractDataRequest):
     """
@@ -874,19 +1278,9 @@ async def extract_batch_data(results: List[Dict[str, Any]]):
     - **results**: OCR 결과 배열 (patient_id, patient_name, text 포함)
     """
     try:
-        extracted_list = []
-        
-        for result in results:
-            ocr_text = result.get("text", "")
-            extracted = extract_dose_data(ocr_text)
-            
-            extracted_list.append({
-                "patient_id": result.get("patient_id", ""),
-                "patient_name": result.get("patient_name", ""),
-                "date": result.get("date", ""),
-                "gender": result.get("gender", ""),
-                **extracted
-            })
+        # 정규식 스캔은 CPU 작업이므로 배치 전체를 한 번에 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        extracted_list = await loop.run_in_executor(None, _extract_batch, results)
         
         return {"success": True, "data": extracted_list}
         
@@ -896,4 +1290,30 @@ async def extract_batch_data(results: List[Dict[str, Any]]):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    
+    # uvloop(libuv 이벤트 루프)과 httptools(HTTP 파서)가 있으면 사용
+    # uvloop은 Windows를 지원하지 않으므로 없으면 기본 asyncio 루프 사용
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
+    # RELOAD=1 이면 개발용 자동 재시작 (이 경우 WORKERS는 무시되고 단일 프로세스로 실행)
+    # Dcas 세션과 OCR 모델은 프로세스 메모리에 있으므로 WORKERS > 1 은
+    # 세션이 워커 간에 공유되지 않고 모델도 워커 수만큼 로드된다는 점에 주의
+    reload = os.getenv("RELOAD", "0") == "1"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop_impl,
+        http=http_impl,
+        workers=None if reload else int(os.getenv("WORKERS", "1")),
+        reload=reload
+    )
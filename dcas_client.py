@@ -5,28 +5,241 @@ Dcas 웹서버에서 환자 검사 기록지를 조회하고
 이미지 URL을 추출하는 클라이언트 클래스를 제공합니다.
 """
 
+import os
 import re
+import json
+import time
+import sqlite3
 import logging
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date
 from io import BytesIO
+from urllib.parse import urlencode
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import numpy as np
 from PIL import Image
 import urllib3
 
-# urllib3 헤더 파싱 경고 무시 (DCAS PHP 서버의 비정상적인 헤더 때문)
-urllib3.disable_warnings(urllib3.exceptions.HeaderParsingError)
-warnings.filterwarnings('ignore', message='Failed to parse headers')
+from utils import _DATACLASS_SLOTS, _fit_size
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# libjpeg-turbo(SIMD) JPEG 디코더 (선택사항 - 없으면 PIL 사용)
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_GRAY
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    # 패키지 미설치 또는 libjpeg-turbo 공유 라이브러리를 찾지 못한 경우
+    _turbo_jpeg = None
+
+
+# 로거 (핸들러/레벨 설정은 애플리케이션 몫 - 단독 실행 시 configure_logging 사용)
 logger = logging.getLogger(__name__)
 
+# 경고 필터 설치 여부 (첫 DcasClient 생성 시 1회만 설치)
+_WARNINGS_INSTALLED = False
+
+
+def configure_logging(level: int = logging.INFO):
+    """
+    로깅을 설정합니다. (import 시 전역 설정을 바꾸지 않도록 필요한 쪽에서 호출)
+    
+    루트 로거에 핸들러가 없으면 기본 핸들러를 추가하고 이 모듈의 로그 레벨을 지정합니다.
+    """
+    logging.basicConfig(level=level)
+    logger.setLevel(level)
+
+
+def _install_warning_filters():
+    """urllib3 헤더 파싱 경고를 무시합니다. (DCAS PHP 서버의 비정상적인 헤더 때문)"""
+    global _WARNINGS_INSTALLED
+    if _WARNINGS_INSTALLED:
+        return
+    urllib3.disable_warnings(urllib3.exceptions.HeaderParsingError)
+    warnings.filterwarnings('ignore', message='Failed to parse headers')
+    _WARNINGS_INSTALLED = True
+
+
+def _jpeg_scaling_factor(longest: int, max_size: int) -> Optional[Tuple[int, int]]:
+    """긴 변이 max_size 이상으로 남는 가장 큰 libjpeg-turbo 축소 배율 (1/8, 1/4, 1/2)"""
+    for denominator in (8, 4, 2):
+        if longest // denominator >= max_size and (1, denominator) in _turbo_jpeg.scaling_factors:
+            return (1, denominator)
+    return None
+
+
+# HTML 파싱 정규식 (모듈 로드 시 1회 컴파일)
+# 환자 리스트: <ul onclick="clkList('cine_no','patient_id',this);"> ... </ul>
+_UL_RE = re.compile(r"<ul onclick=\"clkList\('(\d+)','([^']+)',this\);\">(.*?)</ul>", re.DOTALL)
+_LI_RE = re.compile(r"<li[^>]*>([^<]*)</li>")
+# 리포트 썸네일: <img src=".../swf_s/xxx1020.dcm.JPG">
+_IMG_RE = re.compile(r'<img\s+src="([^"]+/swf_s/[^"]+1020\.dcm\.JPG)"', re.IGNORECASE)
+# 썸네일 URL → 실제 이미지 URL 변환 (앞의 ./ 제거, /swf_s/ → /, .dcm.JPG → .dcm/W0001.jpg)
+_THUMB_REWRITE_RE = re.compile(r'^\./|/swf_s/|(?i:\.dcm\.JPG)$')
+_THUMB_REWRITE_MAP = {'./': '', '/swf_s/': '/'}
+_DIR_RE = re.compile(r'(.*/)([^/]+)$')
+
+# 정규식 파싱 실패 시 사용하는 lxml XPath (C 레벨에서 노드 탐색, 미리 컴파일)
+_CLKLIST_RE = re.compile(r"""clkList\(\s*['"](\d+)['"]\s*,\s*['"]([^'"]+)['"]""")
+_REPORT_THUMB_RE = re.compile(r'/swf_s/[^"]+1020\.dcm\.JPG$', re.IGNORECASE)
+_UL_XPATH = etree.XPath('//ul[contains(@onclick, "clkList(")]')
+_LI_XPATH = etree.XPath('descendant::li[position() <= 6]')
+_THUMB_SRC_XPATH = etree.XPath('//img[contains(@src, "/swf_s/")]/@src')
+
+# 응답 캐시 (모든 DcasClient 인스턴스가 공유 - API는 요청마다 클라이언트를 새로 생성)
+# 항목: key -> (저장 시각, 조건부 요청 헤더, 파싱 결과)
+PATIENT_LIST_CACHE_TTL = 30  # 초 (당일 리스트는 검사가 추가되므로 짧게)
+STUDY_INFO_CACHE_TTL = 600  # 초 (cine_no별 검사 정보는 거의 바뀌지 않음)
+RESPONSE_CACHE_MAX_SIZE = 256
+_patient_list_cache: Dict[Any, tuple] = {}
+_study_info_cache: Dict[Any, tuple] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cache_lookup(cache: Dict[Any, tuple], key) -> Optional[tuple]:
+    """캐시 항목 (저장 시각, 조건부 요청 헤더, 값)을 반환합니다. 만료 여부는 호출자가 판단합니다."""
+    with _response_cache_lock:
+        return cache.get(key)
+
+
+def _cache_store(cache: Dict[Any, tuple], key, validators: Dict[str, str], value):
+    """캐시에 값을 저장합니다. 최대 크기를 넘으면 가장 오래된 항목부터 제거합니다."""
+    with _response_cache_lock:
+        cache.pop(key, None)
+        cache[key] = (time.monotonic(), validators, value)
+        while len(cache) > RESPONSE_CACHE_MAX_SIZE:
+            del cache[next(iter(cache))]
+
+
+def _conditional_headers(response: requests.Response) -> Dict[str, str]:
+    """응답의 ETag/Last-Modified로 다음 요청에 보낼 조건부 요청 헤더를 만듭니다."""
+    validators = {}
+    etag = response.headers.get('ETag')
+    if etag:
+        validators['If-None-Match'] = etag
+    last_modified = response.headers.get('Last-Modified')
+    if last_modified:
+        validators['If-Modified-Since'] = last_modified
+    return validators
+
+
+class StudyInfoDiskCache:
+    """
+    검사 정보 영구 캐시 (SQLite)
+    
+    cine_no는 한 번 발급되면 바뀌지 않으므로 파싱된 이미지 URL을 디스크에 보관해
+    서버 재시작 후나 DCAS 장애 중에도 같은 검사를 다시 열 때 POST 없이 사용합니다.
+    DB를 열 수 없으면 경고를 남기고 캐시 없이 동작합니다.
+    
+    저장 후 검사에 이미지가 추가되면 보관 기간 동안 이전 리포트 URL이 반환되므로
+    (refresh=True 또는 invalidate_cache로 갱신) DCAS_DISK_CACHE=1일 때만 사용됩니다.
+    """
+    
+    def __init__(self, path: str, ttl: float = 30 * 86400):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl: 보관 기간 (초, 기본값: 30일)
+        """
+        self.path = path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """DB 연결 (첫 사용 시 생성, 호출자가 락 보유)"""
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS study_info ("
+                    "cine_no TEXT, patient_id TEXT, image_dir TEXT, image_urls TEXT, fetched_at REAL, "
+                    "PRIMARY KEY (cine_no, patient_id))"
+                )
+                conn.commit()
+                self._conn = conn
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"검사 정보 디스크 캐시 비활성화: {e}")
+                self._disabled = True
+        return self._conn
+    
+    def get(self, cine_no: str, patient_id: str) -> Optional[Tuple[str, List[str]]]:
+        """(image_dir, image_urls)를 반환합니다. 없거나 만료되면 None."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT image_dir, image_urls, fetched_at FROM study_info WHERE cine_no = ? AND patient_id = ?",
+                    (cine_no, patient_id)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"검사 정보 디스크 캐시 조회 실패: {e}")
+                return None
+        if row is None or time.time() - row[2] > self.ttl:
+            return None
+        return row[0], json.loads(row[1])
+    
+    def set(self, cine_no: str, patient_id: str, image_dir: str, image_urls: List[str]):
+        """검사 정보를 저장합니다."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO study_info VALUES (?, ?, ?, ?, ?)",
+                    (cine_no, patient_id, image_dir, json.dumps(image_urls), time.time())
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"검사 정보 디스크 캐시 저장 실패: {e}")
+    
+    def delete(self, cine_no: str):
+        """cine_no의 검사 정보를 삭제합니다."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM study_info WHERE cine_no = ?", (cine_no,))
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"검사 정보 디스크 캐시 삭제 실패: {e}")
+
+
+# 환자 ID와 검사 이미지 URL을 디스크에 남기므로 기본 비활성화
+# DCAS_DISK_CACHE=1 로 활성화, DCAS_CACHE_PATH로 위치 변경 (첫 사용 시 생성)
+_study_disk_cache: Optional[StudyInfoDiskCache] = None
+_study_disk_cache_resolved = False
+_study_disk_cache_lock = threading.Lock()
+
+
+def _get_study_disk_cache() -> Optional[StudyInfoDiskCache]:
+    """검사 정보 디스크 캐시를 반환합니다. (비활성화되어 있으면 None)"""
+    global _study_disk_cache, _study_disk_cache_resolved
+    if _study_disk_cache_resolved:
+        return _study_disk_cache
+    
+    with _study_disk_cache_lock:
+        if not _study_disk_cache_resolved:
+            if os.getenv("DCAS_DISK_CACHE", "0").lower() in ("1", "true", "yes", "on"):
+                _study_disk_cache = StudyInfoDiskCache(
+                    os.getenv("DCAS_CACHE_PATH", os.path.expanduser("~/.dcas_ocr/study_info.sqlite3"))
+                )
+            _study_disk_cache_resolved = True
+    return _study_disk_cache
+
 
 class DcasAuthError(Exception):
     """Dcas 인증 오류"""
@@ -43,7 +256,7 @@ class DcasParseError(Exception):
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PatientInfo:
     """환자 정보 데이터 클래스"""
     cine_no: str  # 검사 번호
@@ -58,7 +271,7 @@ class PatientInfo:
         return f"[{self.patient_id}] {self.patient_name} ({self.gender}/{self.age})"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StudyInfo:
     """검사 정보 데이터 클래스"""
     patient: PatientInfo
@@ -85,6 +298,20 @@ class DcasClient:
     LIST_AJAX_URL = f"{BASE_URL}/inc/listAreaAjax.php"
     VIEW_AJAX_URL = f"{BASE_URL}/inc/viewAreaAjax.php"
     
+    # 모든 세션에 공통으로 붙는 고정 헤더 (클래스 정의 시 1회 생성)
+    # Connection: keep-alive는 requests 기본값이므로 지정하지 않음
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
+        'Accept': 'text/html, */*; q=0.01',
+        'Accept-Language': 'ko,en;q=0.9,en-US;q=0.8',
+        'X-Requested-With': 'XMLHttpRequest',
+        'Origin': BASE_URL,
+        'Referer': f'{BASE_URL}/list.php'
+    }
+    
+    # 기본 커넥션 풀 크기 (더 많은 동시 요청은 ensure_pool_size로 확장)
+    POOL_MAXSIZE = 32
+    
     def __init__(self, user_id: str = "", password: str = ""):
         """
         DcasClient 초기화
@@ -93,18 +320,59 @@ class DcasClient:
             user_id: Dcas 사용자 ID
             password: Dcas 비밀번호
         """
+        _install_warning_filters()
+        
         self.user_id = user_id
         self.password = password
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
-            'Accept': 'text/html, */*; q=0.01',
-            'Accept-Language': 'ko,en;q=0.9,en-US;q=0.8',
-            'X-Requested-With': 'XMLHttpRequest',
-            'Origin': self.BASE_URL,
-            'Referer': f'{self.BASE_URL}/list.php'
-        })
+        
+        # keep-alive 커넥션 풀 + 일시적 오류(502/503/504, 연결 실패) 재시도
+        # DCAS 요청은 모두 조회성이므로 POST도 재시도 대상에 포함
+        self._retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=['GET', 'POST']
+        )
+        self.pool_maxsize = 0
+        self.ensure_pool_size(self.POOL_MAXSIZE)
+        
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        
+        # clkList POST 템플릿 (URL 파싱/세션 헤더 병합을 한 번만 수행, 쿠키는 요청마다 첨부)
+        self._clk_list_template = requests.Request(
+            'POST',
+            self.LIST_AJAX_URL,
+            headers={
+                **self.session.headers,
+                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
+            }
+        ).prepare()
+        self._send_settings = self.session.merge_environment_settings(
+            self.LIST_AJAX_URL, {}, None, None, None
+        )
         self._logged_in = False
+        # True면 요청/파싱 소요 시간을 로그로 남김 (기본값: 비활성)
+        self._profile = False
+        self._state_lock = threading.Lock()
+    
+    def ensure_pool_size(self, size: int):
+        """
+        호스트당 keep-alive 커넥션 풀이 size개 이상의 동시 요청을 수용하도록 키웁니다.
+        
+        풀보다 많은 스레드가 같은 호스트에 요청하면 urllib3가 남는 연결을 버려
+        요청마다 TCP 연결을 새로 맺게 됩니다. 풀은 줄이지 않습니다.
+        
+        Args:
+            size: 동시 요청 수
+        """
+        if size <= self.pool_maxsize:
+            return
+        
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=size, max_retries=self._retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool_maxsize = size
     
     @property
     def is_logged_in(self) -> bool:
@@ -156,9 +424,10 @@ class DcasClient:
                 logger.warning(f"Dcas 로그인 실패: {user_id}")
                 raise DcasAuthError("로그인에 실패했습니다. ID와 비밀번호를 확인해주세요.")
             
-            self._logged_in = True
-            self.user_id = user_id
-            self.password = password
+            with self._state_lock:
+                self._logged_in = True
+                self.user_id = user_id
+                self.password = password
             logger.info(f"Dcas 로그인 성공: {user_id}")
             return True
             
@@ -173,17 +442,21 @@ class DcasClient:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         patient_id: str = "",
-        patient_name: str = ""
+        patient_name: str = "",
+        refresh: bool = False
     ) -> List[PatientInfo]:
         """
         환자 리스트를 조회합니다.
         
+        같은 조건의 조회 결과는 PATIENT_LIST_CACHE_TTL 동안 캐시됩니다.
+        
         Args:
             modality: 검사 종류 (기본값: XA - 관상동맥조영술)
             start_date: 시작일 (YYYY-MM-DD, 기본값: 오늘)
             end_date: 종료일 (YYYY-MM-DD)
             patient_id: 환자 ID 필터
             patient_name: 환자명 필터
+            refresh: True면 캐시를 무시하고 다시 조회
             
         Returns:
             List[PatientInfo]: 환자 정보 리스트
@@ -192,6 +465,11 @@ class DcasClient:
         if start_date is None:
             start_date = date.today().strftime("%Y-%m-%d")
         
+        cache_key = (modality, start_date, end_date or '', patient_id, patient_name)
+        cached = None if refresh else _cache_lookup(_patient_list_cache, cache_key)
+        if cached and time.monotonic() - cached[0] <= PATIENT_LIST_CACHE_TTL:
+            return list(cached[2])
+        
         try:
             # 먼저 list.php에 접근하여 세션 쿠키 획득
             self.session.get(f"{self.BASE_URL}/list.php", timeout=10)
@@ -212,11 +490,13 @@ class DcasClient:
                 'orderByDivs': 'desc'
             }
             
-            # POST 요청 헤더
+            # POST 요청 헤더 (만료된 캐시가 있으면 조건부 요청)
             headers = {
                 'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
                 'Referer': f'{self.BASE_URL}/list.php'
             }
+            if cached:
+                headers.update(cached[1])
             
             response = self.session.post(
                 self.LIST_AJAX_URL,
@@ -224,13 +504,20 @@ class DcasClient:
                 headers=headers,
                 timeout=60
             )
+            
+            # 304 Not Modified: 캐시된 결과 재사용
+            if cached and response.status_code == 304:
+                _cache_store(_patient_list_cache, cache_key, cached[1], cached[2])
+                return list(cached[2])
+            
             response.raise_for_status()
             
             # HTML 파싱하여 환자 리스트 추출
             patients = self._parse_patient_list(response.text)
             logger.info(f"환자 리스트 조회 완료: {len(patients)}명")
             
-            return patients
+            _cache_store(_patient_list_cache, cache_key, _conditional_headers(response), patients)
+            return list(patients)
             
         except requests.RequestException as e:
             raise DcasConnectionError(f"환자 리스트 조회 실패: {str(e)}")
@@ -256,82 +543,112 @@ class DcasClient:
         Returns:
             List[PatientInfo]: 환자 정보 리스트
         """
-        patients = []
+        patients = [
+            self._build_patient(cine_no, patient_id, _LI_RE.findall(li_content))
+            for cine_no, patient_id, li_content in _UL_RE.findall(html)
+        ]
         
-        # 정규식으로 <ul onclick="clkList('cine_no','patient_id',this);"> 패턴 파싱
-        ul_pattern = r"<ul onclick=\"clkList\('(\d+)','([^']+)',this\);\">(.*?)</ul>"
-        ul_matches = re.findall(ul_pattern, html, re.DOTALL)
+        logger.debug("정규식으로 찾은 환자 수: %d", len(patients))
         
-        logger.debug(f"정규식으로 찾은 환자 수: {len(ul_matches)}")
-        
-        for match in ul_matches:
-            try:
-                cine_no = match[0]
-                patient_id = match[1]
-                li_content = match[2]
-                
-                # <li> 태그 내용 추출
-                li_pattern = r"<li[^>]*>([^<]*)</li>"
-                li_values = re.findall(li_pattern, li_content)
-                
-                # 최소 6개의 li가 있어야 함
-                # 0: patient_id, 1: name, 2: modality, 3: datetime, 4: age, 5: gender
-                if len(li_values) >= 6:
-                    patient_name = li_values[1].strip()
-                    study_date = li_values[3].strip()
-                    age = li_values[4].strip()
-                    gender = li_values[5].strip()
-                    
-                    patient = PatientInfo(
-                        cine_no=cine_no,
-                        patient_id=patient_id,
-                        patient_name=patient_name,
-                        gender=gender,
-                        age=age,
-                        study_date=study_date
-                    )
-                    patients.append(patient)
-                    logger.debug(f"환자 파싱 성공: {patient}")
-                else:
-                    # li가 부족한 경우에도 기본 정보로 저장
-                    patient_name = li_values[1].strip() if len(li_values) > 1 else ""
-                    patient = PatientInfo(
-                        cine_no=cine_no,
-                        patient_id=patient_id,
-                        patient_name=patient_name
-                    )
-                    patients.append(patient)
-                    logger.debug(f"환자 파싱 성공 (부분): {patient}")
-                    
-            except Exception as e:
-                logger.debug(f"환자 정보 파싱 오류: {e}")
-                continue
+        # 정규식이 못 찾으면 (속성 순서/따옴표 등 마크업 변형) lxml 파서로 재시도
+        if not patients and 'clkList' in html:
+            patients = self._parse_patient_list_lxml(html)
+            logger.debug("lxml 파서로 찾은 환자 수: %d", len(patients))
         
         # 최종 결과 로깅
         if not patients:
             logger.warning(f"환자 리스트 파싱 실패. HTML 구조 확인 필요.")
             logger.info(f"HTML 응답 전체 길이: {len(html)}")
-            # 디버그용: HTML 처음 1000자 로깅
-            logger.debug(f"HTML 응답 미리보기:\n{html[:1000]}")
+            # 디버그용: HTML 처음 1000자 로깅 (DEBUG가 아니면 슬라이스도 만들지 않음)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HTML 응답 미리보기:\n%s", html[:1000])
         else:
             logger.info(f"환자 {len(patients)}명 파싱 완료")
         
         return patients
     
-    def get_study_info(self, patient: PatientInfo) -> StudyInfo:
+    def _parse_patient_list_lxml(self, html: str) -> List[PatientInfo]:
+        """
+        lxml XPath로 환자 리스트를 파싱합니다. (정규식 파싱 실패 시 대체 경로)
+        
+        DCAS 응답 그대로의 마크업에서는 정규식이 lxml 트리 생성보다 빠르므로
+        정규식을 우선 사용하고, 마크업이 달라 정규식이 못 찾을 때만 사용합니다.
+        """
+        tree = lxml.html.fromstring(html)
+        patients = []
+        
+        for ul in _UL_XPATH(tree):
+            match = _CLKLIST_RE.search(ul.get('onclick', ''))
+            if not match:
+                continue
+            li_values = [li.text_content() for li in _LI_XPATH(ul)]
+            patients.append(self._build_patient(match.group(1), match.group(2), li_values))
+        
+        return patients
+    
+    @staticmethod
+    def _build_patient(cine_no: str, patient_id: str, li_values: List[str]) -> PatientInfo:
+        """
+        <li> 값 목록으로 PatientInfo를 생성합니다.
+        
+        li 순서: 0: patient_id, 1: name, 2: modality, 3: datetime, 4: age, 5: gender
+        """
+        if len(li_values) >= 6:
+            patient = PatientInfo(
+                cine_no=cine_no,
+                patient_id=patient_id,
+                patient_name=li_values[1].strip(),
+                gender=li_values[5].strip(),
+                age=li_values[4].strip(),
+                study_date=li_values[3].strip()
+            )
+            logger.debug("환자 파싱 성공: %s", patient)
+        else:
+            # li가 부족한 경우에도 기본 정보로 저장
+            patient = PatientInfo(
+                cine_no=cine_no,
+                patient_id=patient_id,
+                patient_name=li_values[1].strip() if len(li_values) > 1 else ""
+            )
+            logger.debug("환자 파싱 성공 (부분): %s", patient)
+        return patient
+    
+    def get_study_info(self, patient: PatientInfo, refresh: bool = False) -> StudyInfo:
         """
         환자의 검사 정보 및 이미지 URL을 조회합니다.
         
+        조회 결과는 STUDY_INFO_CACHE_TTL 동안 메모리에, DCAS_DISK_CACHE=1이면
+        30일 동안 디스크에도 (cine_no, patient_id)별로 캐시됩니다.
+        
         Args:
             patient: 환자 정보
+            refresh: True면 캐시를 무시하고 다시 조회
             
         Returns:
             StudyInfo: 검사 정보 (이미지 URL 포함)
         """
-        import time
+        cache_key = (patient.cine_no, patient.patient_id)
+        cached = None if refresh else _cache_lookup(_study_info_cache, cache_key)
+        if cached and time.monotonic() - cached[0] <= STUDY_INFO_CACHE_TTL:
+            return cached[2]
+        
+        # 디스크 캐시 (서버 재시작 후에도 유지)
+        disk_cache = _get_study_disk_cache()
+        if not refresh and cached is None and disk_cache is not None:
+            stored = disk_cache.get(patient.cine_no, patient.patient_id)
+            if stored is not None:
+                image_dir, image_urls = stored
+                study_info = StudyInfo(
+                    patient=patient,
+                    image_dir=image_dir,
+                    file_count=len(image_urls),
+                    image_urls=image_urls
+                )
+                _cache_store(_study_info_cache, cache_key, {}, study_info)
+                return study_info
         
         try:
-            print(f"🔍 검사 정보 조회: {patient.patient_id} (cine_no: {patient.cine_no})")
+            logger.debug("🔍 검사 정보 조회: %s (cine_no: %s)", patient.patient_id, patient.cine_no)
             
             # 환자 선택 (clkList 호출) - 썸네일 이미지 URL이 포함된 응답
             click_payload = {
@@ -340,35 +657,64 @@ class DcasClient:
                 'm_patid': patient.patient_id
             }
             
-            # POST 요청 헤더
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
-            }
+            if self._profile:
+                t1 = time.perf_counter()
+            # 만료된 캐시가 있으면 조건부 요청
+            response = self._send_clk_list(click_payload, cached[1] if cached else {})
+            if self._profile:
+                logger.info("📡 clkList POST 요청: %.3f초", time.perf_counter() - t1)
+            
+            # 304 Not Modified: 캐시된 결과 재사용
+            if cached and response.status_code == 304:
+                _cache_store(_study_info_cache, cache_key, cached[1], cached[2])
+                return cached[2]
             
-            t1 = time.time()
-            response = self.session.post(
-                self.LIST_AJAX_URL,
-                data=click_payload,
-                headers=headers,
-                timeout=30
-            )
             response.raise_for_status()
-            print(f"   📡 clkList POST 요청: {time.time() - t1:.2f}초")
             
-            logger.debug(f"clkList 응답 길이: {len(response.text)}")
+            logger.debug("clkList 응답 길이: %d bytes", len(response.content))
             
             # clkList 응답에서 이미지 URL 파싱
-            t2 = time.time()
+            if self._profile:
+                t2 = time.perf_counter()
             study_info = self._parse_study_info(response.text, patient)
-            print(f"   🔧 HTML 파싱: {time.time() - t2:.2f}초")
+            if self._profile:
+                logger.info("🔧 HTML 파싱: %.3f초", time.perf_counter() - t2)
             
             logger.info(f"검사 정보 조회 완료: {patient.patient_id} - 이미지 {study_info.file_count}개")
             
+            _cache_store(_study_info_cache, cache_key, _conditional_headers(response), study_info)
+            if disk_cache is not None:
+                disk_cache.set(
+                    patient.cine_no, patient.patient_id, study_info.image_dir, study_info.image_urls
+                )
             return study_info
             
         except requests.RequestException as e:
             raise DcasConnectionError(f"검사 정보 조회 실패: {str(e)}")
     
+    def _send_clk_list(self, payload: Dict[str, str], extra_headers: Dict[str, str]) -> requests.Response:
+        """
+        미리 준비한 템플릿을 복사해 clkList POST를 보냅니다.
+        
+        배치 OCR처럼 같은 POST를 반복할 때 요청 준비 비용(URL 파싱, 헤더 병합)을 줄입니다.
+        """
+        request = self._clk_list_template.copy()
+        request.body = urlencode(payload)
+        request.headers['Content-Length'] = str(len(request.body))
+        request.headers.update(extra_headers)
+        request.prepare_cookies(self.session.cookies)
+        return self.session.send(request, timeout=30, **self._send_settings)
+    
+    @staticmethod
+    def invalidate_cache(cine_no: str):
+        """cine_no의 검사 정보 캐시(메모리/디스크)를 삭제합니다."""
+        with _response_cache_lock:
+            for key in [key for key in _study_info_cache if key[0] == cine_no]:
+                del _study_info_cache[key]
+        disk_cache = _get_study_disk_cache()
+        if disk_cache is not None:
+            disk_cache.delete(cine_no)
+    
     def _parse_study_info(self, html: str, patient: PatientInfo) -> StudyInfo:
         """
         HTML에서 검사 정보를 파싱합니다.
@@ -395,42 +741,48 @@ class DcasClient:
         # 정규식으로 썸네일 img src 추출
         # 리포트 이미지는 "1020.dcm.JPG"로 끝나는 파일 중 마지막에서 두번째가 Dose Report
         # <img src="./dicom/Data/2025/12/10/00306304_X/swf_s/xxx1020.dcm.JPG" alt="thumbNail">
-        img_pattern = r'<img\s+src="([^"]+/swf_s/[^"]+1020\.dcm\.JPG)"'
-        img_matches = re.findall(img_pattern, html, re.IGNORECASE)
+        # 필요한 것은 마지막 두 개뿐이므로 전체 리스트를 만들지 않고 순회하며 기억
+        match_count = 0
+        last_src = prev_src = None
+        for match in _IMG_RE.finditer(html):
+            prev_src, last_src = last_src, match.group(1)
+            match_count += 1
+        
+        # 정규식이 못 찾으면 (img 속성 순서 변형 등) lxml 파서로 재시도
+        if not match_count and '/swf_s/' in html:
+            for src in _THUMB_SRC_XPATH(lxml.html.fromstring(html)):
+                if _REPORT_THUMB_RE.search(src):
+                    prev_src, last_src = last_src, src
+                    match_count += 1
         
-        logger.info(f"🔍 리포트 이미지 (1020.dcm) 발견: {len(img_matches)}개")
+        logger.info(f"🔍 리포트 이미지 (1020.dcm) 발견: {match_count}개")
         
         # 마지막에서 두번째 리포트 이미지 사용 (Dose Report)
-        if img_matches:
-            if len(img_matches) >= 2:
-                thumb_src = img_matches[-2]  # 마지막에서 두번째
-            else:
-                thumb_src = img_matches[0]  # 하나뿐이면 그거 사용
+        if match_count:
+            # 하나뿐이면 그거 사용
+            thumb_src = prev_src if match_count >= 2 else last_src
             
-            # 상대 경로 처리
-            if thumb_src.startswith('./'):
-                thumb_src = thumb_src[2:]
-            
-            # 썸네일 URL → 실제 이미지 URL 변환
+            # 썸네일 URL → 실제 이미지 URL 변환 (한 번의 치환으로 처리)
             # ./dicom/Data/2025/12/10/00306304_X/swf_s/xxx1020.dcm.JPG
             # → dicom/Data/2025/12/10/00306304_X/xxx1020.dcm/W0001.jpg
-            
-            # /swf_s/ 제거하고 .JPG를 /W0001.jpg로 변경
-            real_src = thumb_src.replace('/swf_s/', '/')
-            real_src = re.sub(r'\.dcm\.JPG$', '.dcm/W0001.jpg', real_src, flags=re.IGNORECASE)
+            real_src = _THUMB_REWRITE_RE.sub(
+                lambda m: _THUMB_REWRITE_MAP.get(m.group(0), '.dcm/W0001.jpg'),
+                thumb_src
+            )
             
             url = f"{self.BASE_URL}/{real_src}"
             image_urls.append(url)
-            logger.info(f"✅ Dose Report URL (마지막에서 {2 if len(img_matches) >= 2 else 1}번째): {url}")
+            logger.info(f"✅ Dose Report URL (마지막에서 {2 if match_count >= 2 else 1}번째): {url}")
             
             # 디렉토리 경로 추출
-            dir_match = re.match(r'(.*/)([^/]+)$', real_src)
+            dir_match = _DIR_RE.match(real_src)
             if dir_match:
                 image_dir = dir_match.group(1)
         
         if not image_urls:
             logger.warning(f"이미지 URL을 찾을 수 없습니다: {patient.patient_id}")
-            logger.debug(f"HTML 응답 미리보기:\n{html[:2000]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HTML 응답 미리보기:\n%s", html[:2000])
             raise DcasParseError("이미지를 찾을 수 없습니다.")
         
         logger.info(f"이미지 URL {len(image_urls)}개 파싱 완료 (마지막: {image_urls[-1]})")
@@ -442,46 +794,123 @@ class DcasClient:
             image_urls=image_urls
         )
     
-    def download_image(self, url: str) -> np.ndarray:
+    def download_image(
+        self,
+        url: str,
+        roi: Optional[Tuple[int, int, int, int]] = None,
+        mode: str = 'RGB',
+        max_size: Optional[int] = None
+    ) -> np.ndarray:
         """
         이미지를 다운로드하여 numpy 배열로 반환합니다.
         
         Args:
             url: 이미지 URL
+            roi: 잘라낼 영역 (x, y, width, height), 원본 픽셀 좌표.
+                 리포트의 고정 영역만 필요할 때 지정하면 이후 변환/OCR 대상이 그 영역으로 줄어듭니다.
+            mode: 'RGB' (H×W×3) 또는 'L' (그레이스케일 H×W).
+                  다음 단계가 그레이스케일을 받으면 'L'로 지정하세요. JPEG는 디코딩 단계에서
+                  밝기(Y) 채널만 만들어 색 변환 비용과 배열 크기(1/3)가 줄어듭니다.
+            max_size: 긴 변의 최대 픽셀 수 (None이면 원본 크기). 넘으면 비율을 유지해 축소하며,
+                      roi가 없으면 JPEG는 DCT 단계에서 1/2~1/8로 줄여 디코딩합니다.
             
         Returns:
-            np.ndarray: RGB 형식의 이미지 배열
+            np.ndarray: mode 형식의 이미지 배열 (읽기 전용일 수 있음 - 수정하려면 .copy() 사용)
         """
+        if mode not in ('RGB', 'L'):
+            raise ValueError(f"지원하지 않는 mode입니다: {mode}")
+        
         try:
-            print(f"📥 이미지 다운로드: {url}")
+            logger.debug("📥 이미지 다운로드: %s", url)
+            if self._profile:
+                t1 = time.perf_counter()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             # 응답 확인
             content_type = response.headers.get('Content-Type', '')
-            print(f"   Content-Type: {content_type}, 크기: {len(response.content)} bytes")
+            body = response.content
+            logger.debug("Content-Type: %s, 크기: %d bytes", content_type, len(body))
             
-            if 'image' not in content_type.lower() and len(response.content) < 1000:
-                print(f"   ⚠️ 이미지가 아닌 응답: {response.content[:500]}")
+            content_type_lower = content_type.lower()
+            if 'image' not in content_type_lower and len(body) < 1000:
+                logger.warning("⚠️ 이미지가 아닌 응답: %r", body[:500])
                 raise DcasParseError(f"이미지가 아닌 응답을 받았습니다: {content_type}")
             
-            # 이미지 로드
-            image = Image.open(BytesIO(response.content))
-            print(f"   ✅ 이미지 로드 성공: {image.size}, mode={image.mode}")
+            image = None
+            array = None
+            if _turbo_jpeg is not None and 'jp' in content_type_lower:
+                # JPEG는 libjpeg-turbo로 바로 RGB/그레이 배열 디코딩 (PIL 미사용)
+                try:
+                    decode_kwargs = {}
+                    if max_size and roi is None:
+                        width, height, _, _ = _turbo_jpeg.decode_header(body)
+                        scaling_factor = _jpeg_scaling_factor(max(width, height), max_size)
+                        if scaling_factor is not None:
+                            decode_kwargs['scaling_factor'] = scaling_factor
+                    array = _turbo_jpeg.decode(
+                        body,
+                        pixel_format=TJPF_GRAY if mode == 'L' else TJPF_RGB,
+                        **decode_kwargs
+                    )
+                except OSError:
+                    # 손상/비표준 JPEG는 PIL로 재시도
+                    array = None
+            
+            if array is None:
+                image = Image.open(BytesIO(body))
+                # 전체 해상도를 1/2~1/8로 줄여 디코딩 (roi 좌표가 어긋나므로 roi가 있으면 원본 크기)
+                draft_size = _fit_size(image.size, max_size) if roi is None else None
+                if mode == 'L' or draft_size is not None:
+                    # JPEG 디코더가 Y 채널만 출력/DCT 단계에서 축소하도록 설정 (다른 형식은 무시됨)
+                    image.draft(mode, draft_size or image.size)
+                image.load()
+            
+            if self._profile:
+                logger.info("📥 이미지 다운로드/디코딩: %.3f초", time.perf_counter() - t1)
+            
+            # libjpeg-turbo 디코딩 결과는 이미 mode 형식의 배열
+            if image is None:
+                logger.debug("✅ 이미지 로드 성공 (turbojpeg): %s", array.shape)
+                if mode == 'L' and array.ndim == 3:
+                    # TJPF_GRAY 결과는 (H, W, 1)
+                    array = array[:, :, 0]
+                if roi is not None:
+                    x, y, width, height = roi
+                    array = array[y:y + height, x:x + width]
+                target = _fit_size((array.shape[1], array.shape[0]), max_size)
+                if target is not None:
+                    array = np.asarray(Image.fromarray(array).resize(target, Image.LANCZOS))
+                return array
+            
+            logger.debug("✅ 이미지 로드 성공: %s, mode=%s", image.size, image.mode)
+            
+            # 관심 영역만 잘라내기 (RGB 변환/배열 복사 전에 수행)
+            # draft()는 영역이 아닌 전체 해상도를 1/2~1/8로 줄이므로 좌표가 어긋나 사용하지 않음
+            if roi is not None:
+                x, y, width, height = roi
+                image = image.crop((x, y, x + width, y + height))
             
-            # RGB 변환
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # draft()는 2의 거듭제곱으로만 줄이므로 남은 배율은 LANCZOS로 축소
+            target = _fit_size(image.size, max_size)
+            if target is not None:
+                image = image.resize(target, Image.LANCZOS)
             
-            return np.array(image)
+            # RGB/그레이스케일 변환
+            if image.mode != mode:
+                image = image.convert(mode)
+            
+            # PIL 버퍼를 한 번만 복사 (np.array(image)는 tobytes 후 한 번 더 복사)
+            width, height = image.size
+            shape = (height, width, 3) if mode == 'RGB' else (height, width)
+            return np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(shape)
             
         except requests.RequestException as e:
             raise DcasConnectionError(f"이미지 다운로드 실패: {str(e)}")
         except DcasParseError:
             raise
         except Exception as e:
-            import traceback
-            logger.error(f"이미지 처리 오류: {e}\n{traceback.format_exc()}")
+            logger.error("이미지 처리 오류: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise DcasParseError(f"이미지 처리 실패: {str(e)}")
     
     def download_report_image(self, patient: PatientInfo) -> Optional[np.ndarray]:
@@ -501,10 +930,73 @@ class DcasClient:
             return self.download_image(report_url)
         return None
     
+    def download_report_images(
+        self,
+        patients: List[PatientInfo],
+        max_workers: int = 8
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """
+        여러 환자의 리포트 이미지를 병렬로 다운로드합니다.
+        
+        네트워크 대기 위주 작업이므로 스레드 풀에서 공유 세션의
+        keep-alive 커넥션을 재사용해 검사 정보 조회와 이미지 다운로드를 동시에 수행합니다.
+        
+        Args:
+            patients: 환자 정보 리스트
+            max_workers: 동시 요청 수 (필요하면 커넥션 풀을 그만큼 키움)
+        
+        Returns:
+            Dict[str, Optional[np.ndarray]]: cine_no별 리포트 이미지 (실패 시 None)
+        """
+        if not patients:
+            return {}
+        
+        max_workers = max(1, min(max_workers, len(patients)))
+        self.ensure_pool_size(max_workers)
+        images: Dict[str, Optional[np.ndarray]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DcasDownload") as executor:
+            futures = {
+                executor.submit(self.download_report_image, patient): patient
+                for patient in patients
+            }
+            for future in as_completed(futures):
+                patient = futures[future]
+                try:
+                    images[patient.cine_no] = future.result()
+                except (DcasConnectionError, DcasParseError) as e:
+                    logger.warning(f"리포트 이미지 다운로드 실패: {patient.patient_id} - {e}")
+                    images[patient.cine_no] = None
+        
+        return images
+    
+    def check_connection(self, timeout: float = 3.0) -> Tuple[bool, float]:
+        """
+        DCAS 서버 연결 상태를 확인합니다.
+        
+        세션 커넥션 풀을 통해 가벼운 HEAD 요청을 보내므로,
+        성공하면 이후 요청이 재사용할 keep-alive 연결도 미리 열어 둡니다.
+        
+        Args:
+            timeout: 응답 대기 시간 (초)
+        
+        Returns:
+            Tuple[bool, float]: (응답 여부, 소요 시간 ms)
+        """
+        start = time.perf_counter()
+        try:
+            response = self.session.head(f"{self.BASE_URL}/list.php", timeout=timeout, allow_redirects=False)
+            reachable = response.status_code < 500
+        except requests.RequestException as e:
+            logger.warning(f"Dcas 서버 연결 확인 실패: {e}")
+            reachable = False
+        return reachable, (time.perf_counter() - start) * 1000
+    
     def logout(self):
         """세션을 종료합니다."""
         self.session.close()
-        self._logged_in = False
+        with self._state_lock:
+            self._logged_in = False
         logger.info("Dcas 로그아웃 완료")
     
     def __enter__(self):
@@ -834,7 +834,13 @@ function DcasOCRTab({ language, confidenceThreshold }) {
       })
       
       if (response.data.success) {
-        setPreviewImage(response.data.image_data)
+        // 이미지는 JPEG 엔드포인트에서 직접 로드 (base64 변환 없음)
+        const imageParams = new URLSearchParams({
+          cine_no: patient.cine_no,
+          patient_id: patient.patient_id,
+          image_index: response.data.current_index || 0
+        })
+        setPreviewImage(`${API_URL}/dcas/preview/image?${imageParams}`)
         setPreviewUrls(response.data.image_urls || [])
         setPreviewIndex(response.data.current_index || 0)
         setPreviewTotal(response.data.total_images || 0)
@@ -9,17 +9,26 @@ ocr_processor.py - PaddleOCR 기반 텍스트 검출 및 인식 모듈
 """
 
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 import numpy as np
 
 from utils import (
+    _DATACLASS_SLOTS,
     validate_file,
     is_pdf_file,
     load_image,
-    convert_pdf_to_images,
+    decode_image_bytes,
+    iter_pdf_images,
+    convert_pdf_page,
+    get_pdf_page_count,
     preprocess_image,
     parse_lines,
     format_output,
@@ -32,6 +41,30 @@ from utils import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PDF 파이프라인 단계 사이 큐 크기 (대기 중인 페이지 이미지 수 상한, 메모리 제한용)
+PDF_PIPELINE_QUEUE_SIZE = 4
+
+# PDF 파이프라인에서 한 번의 predict()로 묶어 인식할 최대 페이지 수
+PDF_PREDICT_BATCH_SIZE = 4
+
+# 파서 캐시 미결정 표식
+_UNRESOLVED = object()
+
+# 파이프라인 단계 종료 표식
+_PIPELINE_DONE = object()
+
+
+def _engine_input(image):
+    """
+    엔진에 넘길 이미지를 반환합니다 (읽기 전용 배열은 쓰기 가능한 복사본으로).
+    
+    utils의 PDF 페이지/이미지 로더는 복사를 줄이려고 읽기 전용 배열을 반환하지만,
+    PaddleOCR 전처리가 입력을 제자리에서 수정하지 않는다는 보장은 없으므로 경계에서 복사합니다.
+    """
+    if isinstance(image, np.ndarray) and not image.flags.writeable:
+        return image.copy()
+    return image
+
 
 class OCRError(Exception):
     """OCR 처리 오류 예외"""
@@ -43,7 +76,7 @@ class OCRInitError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class OCRResult:
     """OCR 결과 데이터 클래스"""
     text: str
@@ -51,17 +84,25 @@ class OCRResult:
     bbox: Optional[List[List[float]]] = None  # 바운딩 박스 좌표
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PageResult:
     """페이지별 OCR 결과"""
     page_number: int
     results: List[OCRResult]
-    raw_text: str
+    _raw_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def raw_text(self) -> str:
+        """페이지 텍스트 (줄바꿈으로 연결, 처음 접근할 때 생성)"""
+        raw_text = self._raw_text
+        if raw_text is None:
+            raw_text = "\n".join([r.text for r in self.results])
+            object.__setattr__(self, "_raw_text", raw_text)
+        return raw_text
     
     def get_text_with_confidence(self, threshold: float = 0.0) -> str:
         """지정된 신뢰도 이상의 텍스트만 반환"""
-        filtered = [r for r in self.results if r.confidence >= threshold]
-        return "\n".join([r.text for r in filtered])
+        return "\n".join([r.text for r in self.results if r.confidence >= threshold])
 
 
 class OCRProcessor:
@@ -74,6 +115,12 @@ class OCRProcessor:
         det: 텍스트 검출 사용 여부
         rec: 텍스트 인식 사용 여부
         confidence_threshold: 최소 신뢰도 임계값
+        enable_hpi: 고성능 추론 (OpenVINO/ONNXRuntime 자동 선택) 사용 여부
+        rec_batch_num: 텍스트 인식 배치 크기 (None이면 엔진 기본값)
+        device: 추론 장치 ('auto', 'cpu', 'gpu', 'gpu:0' 등, None이면 엔진 기본값)
+        precision: 추론 정밀도 ('fp32', 'fp16', None이면 엔진 기본값)
+        use_tensorrt: GPU에서 TensorRT 사용 여부
+        enable_mkldnn: CPU에서 MKL-DNN(oneDNN) 사용 여부 (None이면 엔진 기본값)
     """
     
     # 지원하는 언어 목록
@@ -89,13 +136,30 @@ class OCRProcessor:
         'cyrillic': '러시아어/키릴 문자',
     }
     
+    # 메모리 프로필별 배치 크기
+    # Paddle 추론 엔진은 배치 크기에 비례해 메모리 아레나를 미리 할당하므로,
+    # 이미지를 한 장씩 처리하면 "low"(배치 1)로 상주 메모리를 크게 줄일 수 있습니다.
+    MEMORY_PROFILES = {
+        "low": {"rec_batch_num": 1, "cls_batch_num": 1},
+        "throughput": {"rec_batch_num": 32, "cls_batch_num": 32},
+    }
+    
     def __init__(
         self,
         lang: str = 'korean',
         use_angle_cls: bool = True,
         det: bool = True,
         rec: bool = True,
-        confidence_threshold: float = 0.3
+        confidence_threshold: float = 0.3,
+        enable_hpi: bool = False,
+        rec_batch_num: Optional[int] = None,
+        device: Optional[str] = None,
+        precision: Optional[str] = None,
+        use_tensorrt: bool = False,
+        enable_mkldnn: Optional[bool] = None,
+        memory_profile: Optional[str] = None,
+        warmup: bool = False,
+        cpu_threads: Optional[int] = None
     ):
         """
         OCR 프로세서를 초기화합니다.
@@ -106,34 +170,187 @@ class OCRProcessor:
             det: 텍스트 검출 사용 여부
             rec: 텍스트 인식 사용 여부
             confidence_threshold: 최소 신뢰도 임계값 (0.0 ~ 1.0)
+            enable_hpi: PaddleOCR 3.x 고성능 추론 사용 여부
+                (HPI 플러그인이 없거나 구버전이면 기본 추론으로 자동 전환)
+            rec_batch_num: 텍스트 인식 배치 크기 (None이면 엔진 기본값)
+                작을수록 Paddle 메모리 아레나 사전 할당이 줄어듭니다.
+            device: 추론 장치 ('cpu', 'gpu', 'gpu:0' 등)
+                'auto'면 사용 가능한 CUDA 장치(CUDA_VISIBLE_DEVICES 반영)가 있을 때 'gpu:0',
+                없으면 'cpu'를 사용합니다. GPU를 요청했는데 엔진이 CPU로 실행되면
+                조용히 느려지는 대신 OCRInitError가 발생합니다.
+            precision: 추론 정밀도 ('fp32', 'fp16' - GPU에서 효과)
+            use_tensorrt: GPU에서 TensorRT 서브그래프 엔진 사용 여부
+            enable_mkldnn: CPU에서 MKL-DNN(oneDNN) 가속 사용 여부
+                (설치된 PaddleOCR가 위 옵션을 지원하지 않으면 기본 추론으로 자동 전환)
+            memory_profile: 배치 크기 프로필 ('low', 'throughput', None이면 엔진 기본값)
+                rec_batch_num을 지정하면 프로필의 인식 배치 크기보다 우선합니다.
+            warmup: 엔진 초기화 직후 더미 이미지로 한 번 추론할지 여부
+                (첫 호출의 커널 선택/그래프 최적화 비용을 초기화 시점으로 이동)
+            cpu_threads: CPU 추론 스레드 수 (None이면 엔진 기본값)
+        
+        Raises:
+            ValueError: 알 수 없는 memory_profile인 경우
         """
+        if memory_profile is not None and memory_profile not in self.MEMORY_PROFILES:
+            raise ValueError(
+                f"알 수 없는 메모리 프로필: {memory_profile} "
+                f"(지원: {', '.join(self.MEMORY_PROFILES)})"
+            )
+        profile = self.MEMORY_PROFILES.get(memory_profile, {})
+        
         self.lang = lang
         self.use_angle_cls = use_angle_cls
         self.det = det
         self.rec = rec
         self.confidence_threshold = confidence_threshold
+        self.enable_hpi = enable_hpi
+        self.memory_profile = memory_profile
+        self.rec_batch_num = rec_batch_num if rec_batch_num is not None else profile.get("rec_batch_num")
+        self.cls_batch_num = profile.get("cls_batch_num")
+        self.device = device
+        self.precision = precision
+        self.use_tensorrt = use_tensorrt
+        self.enable_mkldnn = enable_mkldnn
+        self.warmup = warmup
+        self.cpu_threads = cpu_threads
+        
+        # 워커 프로세스에서 동일한 설정으로 엔진을 만들기 위한 생성 인자
+        self._config = {
+            "lang": lang,
+            "use_angle_cls": use_angle_cls,
+            "det": det,
+            "rec": rec,
+            "confidence_threshold": confidence_threshold,
+            "enable_hpi": enable_hpi,
+            "rec_batch_num": rec_batch_num,
+            "device": device,
+            "precision": precision,
+            "use_tensorrt": use_tensorrt,
+            "enable_mkldnn": enable_mkldnn,
+            "memory_profile": memory_profile,
+            "warmup": warmup,
+            "cpu_threads": cpu_threads,
+        }
         
         self._ocr = None
         self._initialized = False
+        # 백그라운드 사전 초기화와 첫 처리 호출이 겹쳐도 엔진은 한 번만 생성
+        self._init_lock = threading.Lock()
+        # PaddleOCR 엔진은 스레드 안전하지 않으므로 추론 호출을 직렬화
+        self._predict_lock = threading.Lock()
+        # predict() 출력 항목 타입 → 결과 파서 (첫 출력에서 결정)
+        self._item_parsers: Dict[type, Optional[Callable]] = {}
+        # 전처리 결과 버퍼 (스레드별, 가장 큰 이미지 크기로 증가만 함)
+        self._scratch = threading.local()
+    
+    def _scratch_buffer(self, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """현재 스레드의 전처리 버퍼를 shape 크기의 뷰로 반환합니다."""
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        buffer = getattr(self._scratch, "buffer", None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=np.uint8)
+            self._scratch.buffer = buffer
+        return buffer[:size].view(dtype).reshape(shape)
+    
+    def ensure_initialized(self):
+        """
+        OCR 엔진을 지금 초기화합니다. (이미 초기화되었으면 바로 반환)
+        
+        처리 메서드는 엔진을 지연 초기화하므로, 첫 요청 전에 모델 로드 비용을
+        미리 치르려는 경우(예: 다운로드와 병행)에 사용합니다.
+        
+        Raises:
+            OCRInitError: 엔진 초기화 실패 시
+        """
+        self._initialize_ocr()
     
     def _initialize_ocr(self):
-        """PaddleOCR 엔진을 지연 초기화합니다."""
+        """PaddleOCR 엔진을 지연 초기화합니다. (동시에 호출되어도 한 번만 생성)"""
         if self._initialized:
             return
         
+        with self._init_lock:
+            if not self._initialized:
+                self._create_engine()
+    
+    def _create_engine(self):
+        """PaddleOCR 엔진을 생성합니다. (_init_lock 안에서 호출)"""
         try:
             from paddleocr import PaddleOCR
             
             logger.info(f"PaddleOCR 초기화 중... (언어: {self.lang})")
             
-            self._ocr = PaddleOCR(
-                use_angle_cls=self.use_angle_cls,
-                lang=self.lang
-            )
+            ocr_kwargs = {
+                "use_angle_cls": self.use_angle_cls,
+                "lang": self.lang
+            }
+            
+            # PaddleOCR 3.x(predict 지원)와 2.x의 배치 크기 인자 이름이 다름
+            is_v3 = hasattr(PaddleOCR, "predict")
+            if self.rec_batch_num is not None:
+                ocr_kwargs["text_recognition_batch_size" if is_v3 else "rec_batch_num"] = self.rec_batch_num
+            if self.cls_batch_num is not None and self.use_angle_cls:
+                ocr_kwargs["textline_orientation_batch_size" if is_v3 else "cls_batch_num"] = self.cls_batch_num
+            
+            # 추론 백엔드 옵션 (PaddleOCR 3.x 공통 인자, 지정한 것만 전달)
+            backend_kwargs = {}
+            device = self._resolve_device(self.device)
+            if device is not None:
+                if is_v3:
+                    backend_kwargs["device"] = device
+                else:
+                    backend_kwargs["use_gpu"] = device.startswith("gpu")
+            if self.precision is not None:
+                backend_kwargs["precision"] = self.precision
+            if self.use_tensorrt:
+                backend_kwargs["use_tensorrt"] = True
+            if self.enable_mkldnn is not None:
+                backend_kwargs["enable_mkldnn"] = self.enable_mkldnn
+            if self.cpu_threads is not None:
+                backend_kwargs["cpu_threads"] = self.cpu_threads
+            
+            # 시도 순서: HPI + 백엔드 옵션 → 백엔드 옵션만 → 기본 추론
+            attempts = []
+            if self.enable_hpi:
+                attempts.append(("고성능 추론(HPI)", {**backend_kwargs, "enable_hpi": True}))
+            if backend_kwargs:
+                attempts.append((f"추론 옵션 {backend_kwargs}", backend_kwargs))
+            
+            self._ocr = None
+            for description, extra_kwargs in attempts:
+                try:
+                    self._ocr = PaddleOCR(**ocr_kwargs, **extra_kwargs)
+                    logger.info(f"PaddleOCR {description} 활성화")
+                    break
+                except Exception as e:
+                    # 플러그인 미설치, 장치 미지원 또는 해당 인자 미지원 버전
+                    logger.warning(f"{description} 사용 불가, 다음 설정으로 전환: {e}")
+            
+            if self._ocr is None:
+                self._ocr = PaddleOCR(**ocr_kwargs)
+            
+            # CUDA 초기화 실패 시 PaddleOCR가 CPU로 조용히 전환되는 경우 감지
+            active_device = self._active_paddle_device()
+            if active_device is not None:
+                logger.info(f"PaddleOCR 추론 장치: {active_device}")
+            if device is not None and device.startswith("gpu") and active_device is not None \
+                    and not active_device.startswith("gpu"):
+                self._ocr = None
+                message = (
+                    f"GPU({device})를 요청했지만 추론 장치가 {active_device}입니다. "
+                    "CUDA 드라이버, GPU용 paddlepaddle 설치, CUDA_VISIBLE_DEVICES를 확인하세요."
+                )
+                logger.error(message)
+                raise OCRInitError(message)
+            
+            if self.warmup:
+                self._warmup_engine()
             
             self._initialized = True
             logger.info("PaddleOCR 초기화 완료")
             
+        except OCRInitError:
+            raise
         except ImportError:
             raise OCRInitError(
                 "PaddleOCR가 설치되지 않았습니다.\n"
@@ -142,6 +359,52 @@ class OCRProcessor:
         except Exception as e:
             raise OCRInitError(f"PaddleOCR 초기화 실패: {str(e)}")
     
+    @staticmethod
+    def _resolve_device(device: Optional[str]) -> Optional[str]:
+        """'auto'를 실제 추론 장치로 변환합니다 (CUDA_VISIBLE_DEVICES 반영)."""
+        if device != "auto":
+            return device
+        
+        try:
+            import paddle
+            if paddle.device.is_compiled_with_cuda() and paddle.device.cuda.device_count() > 0:
+                return "gpu:0"
+        except Exception as e:
+            logger.warning(f"추론 장치 자동 감지 실패, 엔진 기본값 사용: {e}")
+            return None
+        return "cpu"
+    
+    @staticmethod
+    def _active_paddle_device() -> Optional[str]:
+        """Paddle의 현재 추론 장치를 반환합니다 (확인할 수 없으면 None)."""
+        try:
+            import paddle
+            return paddle.device.get_device()
+        except Exception:
+            return None
+    
+    def _warmup_engine(self):
+        """
+        더미 이미지로 한 번 추론하여 첫 호출 지연을 미리 소모합니다.
+        
+        빈 이미지는 검출 결과가 없어 인식 모델이 실행되지 않으므로,
+        글자 줄처럼 보이는 검은 막대를 그려 검출/인식을 모두 거치게 합니다.
+        """
+        import time
+        
+        image = np.full((640, 640, 3), 255, dtype=np.uint8)
+        for x in range(80, 560, 24):
+            image[300:340, x:x + 14] = 0
+        
+        start_time = time.time()
+        try:
+            with self._predict_lock:
+                self._ocr.predict(image)
+            logger.info(f"PaddleOCR 워밍업 완료: {time.time() - start_time:.2f}초")
+        except Exception as e:
+            # 워밍업 실패는 실제 처리에 영향이 없으므로 경고만 남김
+            logger.warning(f"PaddleOCR 워밍업 실패: {e}")
+    
     def _extract_results_v2(self, ocr_output) -> List[OCRResult]:
         """
         ocr() 메서드 출력을 OCRResult 리스트로 변환합니다.
@@ -178,16 +441,102 @@ class OCRProcessor:
                                 bbox=bbox
                             ))
         except Exception as e:
-            logger.warning(f"결과 추출 v2 오류: {e}")
+            logger.warning("결과 추출 v2 오류: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        
+        return results
+    
+    @staticmethod
+    def _build_results(
+        rec_texts,
+        rec_scores,
+        dt_polys,
+        threshold: float,
+        zero_score_as_missing: bool = False
+    ) -> List[OCRResult]:
+        """
+        predict() 딕셔너리 출력의 병렬 배열을 OCRResult 리스트로 변환합니다.
+        
+        신뢰도 필터링을 numpy 마스크로 먼저 수행하여 임계값 미만 항목은
+        OCRResult를 만들지 않습니다. 점수가 없는 항목의 신뢰도는 1.0입니다.
+        """
+        n = len(rec_texts)
+        if n == 0:
+            return []
+        
+        scores = np.ones(n, dtype=np.float64)
+        m = min(n, len(rec_scores))
+        if m:
+            scores[:m] = np.asarray(rec_scores[:m], dtype=np.float64)
+            if zero_score_as_missing:
+                # 0점만 누락으로 간주 (NaN은 그대로 두어 임계값 비교에서 걸러지게 함)
+                head = scores[:m]
+                head[head == 0] = 1.0
         
+        n_polys = len(dt_polys)
+        return [
+            OCRResult(
+                text=str(rec_texts[i]),
+                confidence=float(scores[i]),
+                bbox=dt_polys[i] if i < n_polys else None
+            )
+            for i in np.flatnonzero(scores >= threshold).tolist()
+            if rec_texts[i]
+        ]
+    
+    def _resolve_item_parser(self, item_type: type) -> Optional[Callable[[object, float], List[OCRResult]]]:
+        """predict() 리스트 출력 항목의 타입에 맞는 파서를 반환합니다 (지원하지 않으면 None)."""
+        if issubclass(item_type, dict):
+            # PaddleOCR 3.x: 페이지별 결과 딕셔너리 (OCRResult 등 dict 하위 클래스)
+            return self._parse_dict_item
+        if issubclass(item_type, list):
+            # PaddleOCR 2.x: [[bbox, (text, confidence)], ...]
+            return self._parse_legacy_lines
+        return None
+    
+    def _parse_dict_item(self, item: dict, threshold: float) -> List[OCRResult]:
+        rec_texts = item.get('rec_texts', item.get('rec_text', []))
+        rec_scores = item.get('rec_scores', item.get('rec_score', []))
+        dt_polys = item.get('dt_polys', item.get('dt_poly', []))
+        
+        if isinstance(rec_texts, str):
+            rec_texts = [rec_texts]
+            rec_scores = [rec_scores] if not isinstance(rec_scores, list) else rec_scores
+        
+        return self._build_results(
+            rec_texts, rec_scores, dt_polys, threshold,
+            zero_score_as_missing=True
+        )
+    
+    @staticmethod
+    def _parse_legacy_lines(lines: list, threshold: float) -> List[OCRResult]:
+        results = []
+        for line in lines:
+            if not line or len(line) < 2:
+                continue
+            
+            bbox = line[0]
+            text_info = line[1]
+            
+            if isinstance(text_info, tuple) and len(text_info) >= 2:
+                # 엔진은 대부분 str/float를 그대로 반환하므로 타입이 다를 때만 변환
+                text, confidence = text_info[0], text_info[1]
+                if type(confidence) is not float:
+                    confidence = float(confidence)
+                if confidence >= threshold:
+                    results.append(OCRResult(
+                        text=text if type(text) is str else str(text),
+                        confidence=confidence,
+                        bbox=bbox
+                    ))
         return results
     
-    def _extract_results(self, ocr_output) -> List[OCRResult]:
+    def _extract_results(self, ocr_output, threshold: float = 0.0) -> List[OCRResult]:
         """
         PaddleOCR 출력을 OCRResult 리스트로 변환합니다.
         
         Args:
             ocr_output: PaddleOCR.predict() 반환값
+            threshold: 신뢰도 임계값 (미만인 결과는 제외)
             
         Returns:
             List[OCRResult]: 변환된 결과 리스트
@@ -207,64 +556,27 @@ class OCRProcessor:
                 dt_polys = ocr_output.get('dt_polys', ocr_output.get('dt_poly', []))
                 
                 if isinstance(rec_texts, list):
-                    for i, text in enumerate(rec_texts):
-                        confidence = rec_scores[i] if i < len(rec_scores) else 1.0
-                        bbox = dt_polys[i] if i < len(dt_polys) else None
-                        
-                        if text:
-                            results.append(OCRResult(
-                                text=str(text),
-                                confidence=float(confidence),
-                                bbox=bbox
-                            ))
+                    results.extend(self._build_results(rec_texts, rec_scores, dt_polys, threshold))
             elif isinstance(ocr_output, list):
-                # 리스트 형식 - 여러 가지 가능한 형식 처리
+                # 리스트 형식 - 항목 타입별 파서를 한 번만 결정하여 재사용
+                parsers = self._item_parsers
                 for item in ocr_output:
                     if item is None:
                         continue
                     
-                    # 딕셔너리 아이템인 경우
-                    if isinstance(item, dict):
-                        rec_texts = item.get('rec_texts', item.get('rec_text', []))
-                        rec_scores = item.get('rec_scores', item.get('rec_score', []))
-                        dt_polys = item.get('dt_polys', item.get('dt_poly', []))
-                        
-                        if isinstance(rec_texts, str):
-                            rec_texts = [rec_texts]
-                            rec_scores = [rec_scores] if not isinstance(rec_scores, list) else rec_scores
-                        
-                        for i, text in enumerate(rec_texts):
-                            confidence = rec_scores[i] if i < len(rec_scores) else 1.0
-                            bbox = dt_polys[i] if i < len(dt_polys) else None
-                            
-                            if text:
-                                results.append(OCRResult(
-                                    text=str(text),
-                                    confidence=float(confidence) if confidence else 1.0,
-                                    bbox=bbox
-                                ))
-                    # 기존 형식 (리스트 of 리스트)
-                    elif isinstance(item, list):
-                        for line in item:
-                            if not line or len(line) < 2:
-                                continue
-                            
-                            bbox = line[0]
-                            text_info = line[1]
-                            
-                            if isinstance(text_info, tuple) and len(text_info) >= 2:
-                                text = str(text_info[0])
-                                confidence = float(text_info[1])
-                                
-                                results.append(OCRResult(
-                                    text=text,
-                                    confidence=confidence,
-                                    bbox=bbox
-                                ))
+                    item_type = type(item)
+                    parser = parsers.get(item_type, _UNRESOLVED)
+                    if parser is _UNRESOLVED:
+                        parser = parsers[item_type] = self._resolve_item_parser(item_type)
+                    if parser is not None:
+                        results.extend(parser(item, threshold))
         except Exception as e:
-            logger.warning(f"결과 추출 중 오류: {e}, 원본 출력 타입: {type(ocr_output)}")
-            # 디버깅을 위해 원본 출력 로깅
-            logger.debug(f"OCR 원본 출력: {ocr_output}")
+            logger.warning(
+                "결과 추출 중 오류: %s, 원본 출력 타입: %s", e, type(ocr_output),
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            # 디버깅을 위해 원본 출력 로깅 (입력 이미지를 포함할 수 있어 DEBUG일 때만 문자열화)
+            logger.debug("OCR 원본 출력: %s", ocr_output)
         
         return results
     
@@ -303,45 +615,104 @@ class OCRProcessor:
                 # 파일 경로를 직접 PaddleOCR에 전달
                 logger.info(f"🖼️ OCR 실행 시작: {image}")
                 start_time = time.time()
-                ocr_output = self._ocr.predict(image)
+                with self._predict_lock:
+                    ocr_output = self._ocr.predict(image)
                 elapsed = time.time() - start_time
                 logger.info(f"⏱️ OCR 실행 완료: {elapsed:.2f}초")
             else:
                 # numpy 배열인 경우
                 img_array = image
                 if preprocess:
-                    img_array = preprocess_image(img_array)
+                    # predict()가 끝나면 더 이상 참조하지 않으므로 버퍼 재사용
+                    img_array = preprocess_image(
+                        img_array,
+                        out=self._scratch_buffer(img_array.shape, img_array.dtype)
+                    )
+                img_array = _engine_input(img_array)
                 logger.info(f"🖼️ OCR 실행 시작 (numpy array: {img_array.shape})")
                 start_time = time.time()
-                ocr_output = self._ocr.predict(img_array)
+                with self._predict_lock:
+                    ocr_output = self._ocr.predict(img_array)
                 elapsed = time.time() - start_time
                 logger.info(f"⏱️ OCR 실행 완료: {elapsed:.2f}초")
             
             # 결과 추출
             logger.info("📝 OCR 결과 추출 중...")
-            results = self._extract_results(ocr_output)
-            
-            # 신뢰도 필터링
-            filtered_results = [r for r in results if r.confidence >= threshold]
+            # 신뢰도 필터링은 추출 단계에서 수행
+            results = self._extract_results(ocr_output, threshold)
             
-            logger.info(f"✅ 인식 완료: 전체 {len(results)}개, 필터링 후 {len(filtered_results)}개")
+            logger.info(f"✅ 인식 완료: {len(results)}개 (신뢰도 {threshold} 이상)")
             
-            return filtered_results
+            return results
             
         except ImageProcessingError as e:
             raise OCRError(f"이미지 처리 오류: {str(e)}")
         except Exception as e:
-            import traceback
-            error_detail = traceback.format_exc()
-            logger.error(f"OCR 처리 상세 오류:\n{error_detail}")
+            # 스택 트레이스는 DEBUG 레벨에서만 포함 (페이지마다 실패할 때 문자열화 비용 방지)
+            logger.error("OCR 처리 중 오류: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise OCRError(f"OCR 처리 중 오류 발생: {str(e)}")
     
+    def process_batch(
+        self,
+        images: List[Union[str, np.ndarray]],
+        confidence_threshold: Optional[float] = None
+    ) -> List[List[OCRResult]]:
+        """
+        여러 이미지를 한 번의 predict() 호출로 인식합니다.
+        
+        이미지마다 predict()를 호출하는 것보다 엔진 진입 비용이 분산됩니다.
+        
+        Args:
+            images: 이미지 파일 경로 또는 numpy 배열 리스트
+            confidence_threshold: 신뢰도 임계값 (None이면 인스턴스 기본값 사용)
+        
+        Returns:
+            List[List[OCRResult]]: 입력 순서와 동일한 이미지별 OCR 결과 리스트
+        
+        Raises:
+            OCRError: OCR 처리 실패 시
+        """
+        import time
+        
+        if not images:
+            return []
+        
+        self._initialize_ocr()
+        
+        threshold = confidence_threshold if confidence_threshold is not None else self.confidence_threshold
+        
+        try:
+            logger.info(f"🖼️ 배치 OCR 실행 시작: {len(images)}개")
+            start_time = time.time()
+            images = [_engine_input(image) for image in images]
+            with self._predict_lock:
+                ocr_outputs = list(self._ocr.predict(images))
+            elapsed = time.time() - start_time
+            logger.info(f"⏱️ 배치 OCR 실행 완료: {elapsed:.2f}초")
+            
+            if len(ocr_outputs) != len(images):
+                raise OCRError(
+                    f"배치 OCR 결과 개수({len(ocr_outputs)})가 입력 개수({len(images)})와 다릅니다."
+                )
+            
+            return [
+                self._extract_results([output], threshold)
+                for output in ocr_outputs
+            ]
+        
+        except OCRError:
+            raise
+        except Exception as e:
+            logger.error("배치 OCR 처리 오류: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise OCRError(f"배치 OCR 처리 중 오류 발생: {str(e)}")
+    
     def process_file(
         self,
         file_path: str,
         confidence_threshold: Optional[float] = None,
         preprocess: bool = False,
-        pdf_dpi: int = 200
+        pdf_dpi: int = 200,
+        num_workers: int = 1
     ) -> List[PageResult]:
         """
         파일(이미지 또는 PDF)에서 텍스트를 인식합니다.
@@ -351,6 +722,8 @@ class OCRProcessor:
             confidence_threshold: 신뢰도 임계값
             preprocess: 이미지 전처리 적용 여부
             pdf_dpi: PDF 변환 해상도
+            num_workers: PDF 페이지 병렬 처리 프로세스 수 (1이면 단일 엔진 파이프라인)
+                프로세스마다 엔진을 새로 로드하므로 페이지가 많은 PDF에서만 유리합니다.
             
         Returns:
             List[PageResult]: 페이지별 OCR 결과 리스트
@@ -370,24 +743,21 @@ class OCRProcessor:
             if is_pdf_file(file_path):
                 # PDF 처리
                 logger.info(f"PDF 파일 처리 중: {file_path}")
-                images = convert_pdf_to_images(file_path, dpi=pdf_dpi)
-                
-                for page_num, img in enumerate(images, start=1):
-                    logger.info(f"페이지 {page_num}/{len(images)} 처리 중...")
-                    
-                    results = self.process_image(
-                        img,
+                if num_workers > 1:
+                    page_results = self._process_pdf_parallel(
+                        file_path,
                         confidence_threshold=confidence_threshold,
-                        preprocess=preprocess
+                        preprocess=preprocess,
+                        pdf_dpi=pdf_dpi,
+                        num_workers=num_workers
+                    )
+                else:
+                    page_results = self._process_pdf_pipelined(
+                        file_path,
+                        confidence_threshold=confidence_threshold,
+                        preprocess=preprocess,
+                        pdf_dpi=pdf_dpi
                     )
-                    
-                    raw_text = "\n".join([r.text for r in results])
-                    
-                    page_results.append(PageResult(
-                        page_number=page_num,
-                        results=results,
-                        raw_text=raw_text
-                    ))
             else:
                 # 이미지 처리
                 logger.info(f"이미지 파일 처리 중: {file_path}")
@@ -398,12 +768,9 @@ class OCRProcessor:
                     preprocess=preprocess
                 )
                 
-                raw_text = "\n".join([r.text for r in results])
-                
                 page_results.append(PageResult(
                     page_number=1,
-                    results=results,
-                    raw_text=raw_text
+                    results=results
                 ))
             
             return page_results
@@ -413,6 +780,228 @@ class OCRProcessor:
         except Exception as e:
             raise OCRError(f"파일 처리 중 오류 발생: {str(e)}")
     
+    def _process_pdf_pipelined(
+        self,
+        file_path: str,
+        confidence_threshold: Optional[float] = None,
+        preprocess: bool = False,
+        pdf_dpi: int = 200
+    ) -> List[PageResult]:
+        """
+        PDF를 변환 → 인식 → 결과 추출의 3단계 파이프라인으로 처리합니다.
+        
+        변환 스레드가 페이지를 하나씩 렌더링하는 동안 인식 스레드가 이전 페이지를
+        OCR하고, 호출 스레드는 결과 추출/필터링을 담당합니다. 단계 사이 큐는
+        PDF_PIPELINE_QUEUE_SIZE로 제한되어 렌더링된 페이지가 무한히 쌓이지 않습니다.
+        
+        인식 스레드는 이미 렌더링되어 대기 중인 페이지를 최대 PDF_PREDICT_BATCH_SIZE개까지
+        모아 한 번의 predict()로 처리합니다 (대기 페이지가 하나뿐이면 배치하지 않음).
+        """
+        self._initialize_ocr()
+        
+        threshold = confidence_threshold if confidence_threshold is not None else self.confidence_threshold
+        page_count = get_pdf_page_count(file_path)
+        
+        rendered = queue.Queue(maxsize=PDF_PIPELINE_QUEUE_SIZE)
+        recognized = queue.Queue(maxsize=PDF_PIPELINE_QUEUE_SIZE)
+        # 각 단계의 소비자가 종료되었음을 알리는 이벤트 (생산자가 가득 찬 큐에서 멈추지 않도록)
+        recognizer_done = threading.Event()
+        consumer_done = threading.Event()
+        
+        def put(q: queue.Queue, item, consumer_gone: threading.Event) -> bool:
+            while not consumer_gone.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def render_stage():
+            try:
+                for page_num, img in iter_pdf_images(file_path, dpi=pdf_dpi, page_count=page_count):
+                    if preprocess:
+                        img = preprocess_image(img)
+                    # 복사가 필요하면 인식 스레드가 아닌 변환 스레드에서 수행
+                    img = _engine_input(img)
+                    if not put(rendered, (page_num, img), recognizer_done):
+                        return
+                    # 다음 페이지를 렌더링하는 동안 이 스레드가 이전 페이지를 붙잡지 않도록 해제
+                    del img
+            finally:
+                put(rendered, _PIPELINE_DONE, recognizer_done)
+        
+        def recognize_stage():
+            try:
+                finished = False
+                while not finished:
+                    item = rendered.get()
+                    if item is _PIPELINE_DONE:
+                        break
+                    
+                    # 이미 렌더링된 페이지를 기다리지 않고 모아서 배치 구성
+                    batch = [item]
+                    while len(batch) < PDF_PREDICT_BATCH_SIZE:
+                        try:
+                            item = rendered.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is _PIPELINE_DONE:
+                            finished = True
+                            break
+                        batch.append(item)
+                    
+                    page_nums = [page_num for page_num, _ in batch]
+                    logger.info(f"페이지 {page_nums}/{page_count} 처리 중...")
+                    
+                    if len(batch) == 1:
+                        with self._predict_lock:
+                            outputs = [self._ocr.predict(batch[0][1])]
+                    else:
+                        with self._predict_lock:
+                            outputs = [[output] for output in self._ocr.predict([img for _, img in batch])]
+                        if len(outputs) != len(batch):
+                            raise OCRError(
+                                f"배치 OCR 결과 개수({len(outputs)})가 입력 개수({len(batch)})와 다릅니다."
+                            )
+                    
+                    for page_num, ocr_output in zip(page_nums, outputs):
+                        if not put(recognized, (page_num, ocr_output), consumer_done):
+                            return
+                    # 엔진 출력은 입력 이미지를 참조하므로 다음 페이지 대기 전에 해제
+                    del batch, item, outputs, ocr_output
+            finally:
+                recognizer_done.set()
+                put(recognized, _PIPELINE_DONE, consumer_done)
+        
+        page_results = []
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-ocr") as executor:
+            render_future = executor.submit(render_stage)
+            recognize_future = executor.submit(recognize_stage)
+            try:
+                while True:
+                    item = recognized.get()
+                    if item is _PIPELINE_DONE:
+                        break
+                    page_num, ocr_output = item
+                    results = self._extract_results(ocr_output, threshold)
+                    del item, ocr_output
+                    page_results.append(PageResult(
+                        page_number=page_num,
+                        results=results
+                    ))
+            finally:
+                consumer_done.set()
+            
+            # 단계에서 발생한 예외 전파 (변환 오류가 인식 오류보다 근본 원인)
+            render_future.result()
+            recognize_future.result()
+        
+        return page_results
+    
+    def _process_pdf_parallel(
+        self,
+        file_path: str,
+        confidence_threshold: Optional[float] = None,
+        preprocess: bool = False,
+        pdf_dpi: int = 200,
+        num_workers: int = 2
+    ) -> List[PageResult]:
+        """
+        PDF 페이지를 프로세스 풀로 병렬 처리합니다.
+        
+        PaddleOCR 엔진은 인스턴스 공유 시 스레드 안전하지 않으므로 프로세스마다
+        엔진을 하나씩 두고, 각 워커가 담당 페이지를 직접 렌더링합니다
+        (페이지 이미지를 프로세스 간에 전달하지 않음).
+        
+        사용 가능한 CPU를 워커 수로 나누어 워커마다 서로 다른 CPU 묶음에 고정하고
+        (Linux), 추론 스레드 수도 그 묶음 크기로 맞춰 과다 구독을 막습니다.
+        """
+        threshold = confidence_threshold if confidence_threshold is not None else self.confidence_threshold
+        page_count = get_pdf_page_count(file_path)
+        num_workers = min(num_workers, page_count)
+        
+        if hasattr(os, "sched_getaffinity"):
+            available_cpus = sorted(os.sched_getaffinity(0))
+        else:
+            available_cpus = list(range(os.cpu_count() or 1))
+        cpus_per_worker = max(1, len(available_cpus) // num_workers)
+        
+        config = dict(self._config)
+        if config["cpu_threads"] is None:
+            config["cpu_threads"] = cpus_per_worker
+        
+        # 워커가 하나씩 가져갈 CPU 묶음 (초기화 시점에 워커 번호를 알 수 없으므로 큐로 배분)
+        mp_context = multiprocessing.get_context()
+        cpu_slots = mp_context.Queue()
+        for i in range(num_workers):
+            cpu_slots.put(available_cpus[i * cpus_per_worker:(i + 1) * cpus_per_worker])
+        
+        logger.info(
+            f"PDF {page_count}페이지를 {num_workers}개 프로세스로 병렬 처리 "
+            f"(워커당 CPU {cpus_per_worker}개)"
+        )
+        
+        page_results = []
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=mp_context,
+            initializer=_init_page_worker,
+            initargs=(config, cpu_slots)
+        ) as executor:
+            pages = executor.map(
+                _ocr_pdf_page,
+                [file_path] * page_count,
+                range(1, page_count + 1),
+                [pdf_dpi] * page_count,
+                [threshold] * page_count,
+                [preprocess] * page_count,
+                chunksize=1
+            )
+            for page_num, results in enumerate(pages, start=1):
+                page_results.append(PageResult(
+                    page_number=page_num,
+                    results=results
+                ))
+        
+        return page_results
+    
+    def process_bytes(
+        self,
+        data: bytes,
+        confidence_threshold: Optional[float] = None,
+        preprocess: bool = False
+    ) -> List[PageResult]:
+        """
+        메모리의 이미지 바이트에서 텍스트를 인식합니다. (임시 파일 없이 처리)
+        
+        Args:
+            data: 인코딩된 이미지 바이트
+            confidence_threshold: 신뢰도 임계값
+            preprocess: 이미지 전처리 적용 여부
+        
+        Returns:
+            List[PageResult]: 페이지별 OCR 결과 리스트 (단일 페이지)
+        
+        Raises:
+            OCRError: 이미지 디코딩 또는 OCR 처리 실패 시
+        """
+        try:
+            image = decode_image_bytes(data)
+        except ImageProcessingError as e:
+            raise OCRError(f"이미지 처리 오류: {str(e)}")
+        
+        results = self.process_image(
+            image,
+            confidence_threshold=confidence_threshold,
+            preprocess=preprocess
+        )
+        
+        return [PageResult(
+            page_number=1,
+            results=results
+        )]
+    
     def get_text(
         self,
         file_path: str,
@@ -434,77 +1023,149 @@ class OCRProcessor:
         """
         page_results = self.process_file(file_path, confidence_threshold)
         
+        if include_confidence:
+            def page_text(page_result: PageResult) -> str:
+                return "\n".join([f"{r.text} (신뢰도: {r.confidence:.2%})" for r in page_result.results])
+        else:
+            # raw_text는 이미 페이지 텍스트를 줄바꿈으로 이은 문자열이므로 다시 조합하지 않음
+            def page_text(page_result: PageResult) -> str:
+                return page_result.raw_text
+        
         if len(page_results) == 1:
             # 단일 페이지
-            results = page_results[0].results
-            lines = []
-            for r in results:
-                if include_confidence:
-                    lines.append(f"{r.text} (신뢰도: {r.confidence:.2%})")
-                else:
-                    lines.append(r.text)
-            return "\n".join(lines)
-        else:
-            # 다중 페이지 (PDF)
-            all_text = []
-            for page_result in page_results:
-                if page_separator:
-                    all_text.append(page_separator.format(page=page_result.page_number))
-                
-                for r in page_result.results:
-                    if include_confidence:
-                        all_text.append(f"{r.text} (신뢰도: {r.confidence:.2%})")
-                    else:
-                        all_text.append(r.text)
-            
-            return "\n".join(all_text)
+            return page_text(page_results[0])
+        
+        # 다중 페이지 (PDF)
+        all_text = []
+        for page_result in page_results:
+            if page_separator:
+                all_text.append(page_separator.format(page=page_result.page_number))
+            if page_result.results:
+                all_text.append(page_text(page_result))
+        
+        return "\n".join(all_text)
     
     def get_results_with_bbox(
         self,
         file_path: str,
-        confidence_threshold: Optional[float] = None
-    ) -> List[dict]:
+        confidence_threshold: Optional[float] = None,
+        return_numpy: bool = False
+    ) -> Union[List[dict], dict]:
         """
         바운딩 박스 좌표를 포함한 상세 결과를 반환합니다.
         
         Args:
             file_path: 파일 경로
             confidence_threshold: 신뢰도 임계값
+            return_numpy: True면 결과별 dict 대신 열 단위 배열을 반환
+                bbox가 하나의 연속 (N, 4, 2) float32 배열이 되어
+                tobytes()나 orjson(OPT_SERIALIZE_NUMPY)으로 바로 직렬화할 수 있습니다.
             
         Returns:
-            List[dict]: 상세 OCR 결과 리스트
+            List[dict]: 상세 OCR 결과 리스트 (bbox는 JSON 직렬화 가능한 리스트)
+            dict: return_numpy=True인 경우
+                {"pages": int32 (N,), "texts": List[str],
+                 "confidences": float32 (N,), "bboxes": float32 (N, 4, 2)}
         """
         page_results = self.process_file(file_path, confidence_threshold)
         
+        if return_numpy:
+            return self._results_to_arrays(page_results)
+        
         detailed_results = []
         for page_result in page_results:
             for r in page_result.results:
+                bbox = r.bbox
                 detailed_results.append({
                     "page": page_result.page_number,
                     "text": r.text,
                     "confidence": r.confidence,
-                    "bbox": r.bbox
+                    "bbox": bbox.tolist() if isinstance(bbox, np.ndarray) else bbox
                 })
         
         return detailed_results
     
+    @staticmethod
+    def _results_to_arrays(page_results: List[PageResult]) -> dict:
+        """
+        페이지 결과를 열 단위 numpy 배열로 변환합니다.
+        
+        4점이 아닌 다각형은 외접 사각형의 4점으로, bbox가 없으면 NaN으로 채웁니다.
+        """
+        count = sum(len(page_result.results) for page_result in page_results)
+        pages = np.empty(count, dtype=np.int32)
+        confidences = np.empty(count, dtype=np.float32)
+        bboxes = np.full((count, 4, 2), np.nan, dtype=np.float32)
+        texts = []
+        
+        i = 0
+        for page_result in page_results:
+            for r in page_result.results:
+                pages[i] = page_result.page_number
+                confidences[i] = r.confidence
+                texts.append(r.text)
+                
+                if r.bbox is not None:
+                    points = np.asarray(r.bbox, dtype=np.float32).reshape(-1, 2)
+                    if points.shape[0] == 4:
+                        bboxes[i] = points
+                    elif points.shape[0]:
+                        (x0, y0), (x1, y1) = points.min(axis=0), points.max(axis=0)
+                        bboxes[i] = ((x0, y0), (x1, y0), (x1, y1), (x0, y1))
+                i += 1
+        
+        return {
+            "pages": pages,
+            "texts": texts,
+            "confidences": confidences,
+            "bboxes": bboxes,
+        }
+    
     @classmethod
     def get_supported_languages(cls) -> dict:
         """지원하는 언어 목록을 반환합니다."""
         return cls.SUPPORTED_LANGUAGES.copy()
     
+    def close(self):
+        """
+        OCR 엔진을 해제합니다.
+        
+        이후 처리 메서드를 호출하면 엔진이 다시 지연 초기화됩니다.
+        """
+        with self._predict_lock:
+            self._ocr = None
+            self._initialized = False
+        self._scratch = threading.local()
+    
     def set_language(self, lang: str):
         """
         인식 언어를 변경합니다. (엔진 재초기화 필요)
         
+        get_cached_processor로 공유되는 인스턴스는 다른 사용자의 캐시 항목까지
+        다른 언어 엔진으로 바뀌므로 변경할 수 없습니다.
+        새 언어는 get_cached_processor(lang)로 받으세요.
+        
         Args:
             lang: 새 언어 코드
+        
+        Raises:
+            RuntimeError: 공유(캐시된) 프로세서에서 호출한 경우
         """
-        if lang != self.lang:
+        if lang == self.lang:
+            return
+        
+        if _processor_cache.get((self.lang, self.use_angle_cls, self.det, self.rec)) is self:
+            raise RuntimeError(
+                f"공유 OCR 프로세서의 언어는 변경할 수 없습니다. "
+                f"get_cached_processor('{lang}')를 사용하세요."
+            )
+        
+        with self._init_lock, self._predict_lock:
             self.lang = lang
+            self._config["lang"] = lang
             self._initialized = False
             self._ocr = None
-            logger.info(f"언어 변경됨: {lang}")
+        logger.info(f"언어 변경됨: {lang}")
     
     def set_confidence_threshold(self, threshold: float):
         """
@@ -520,16 +1181,71 @@ class OCRProcessor:
             raise ValueError("임계값은 0.0에서 1.0 사이여야 합니다.")
 
 
-# 편의를 위한 싱글톤 인스턴스
-_default_processor: Optional[OCRProcessor] = None
+# 편의 함수용 프로세서 캐시 ((lang, use_angle_cls, det, rec) → 프로세서)
+# 엔진 로드에 수 초가 걸리므로 같은 설정은 하나의 인스턴스를 재사용
+_processor_cache: Dict[Tuple[str, bool, bool, bool], OCRProcessor] = {}
+_processor_cache_lock = threading.Lock()
+
+
+# 페이지 병렬 처리 워커 프로세스의 OCR 엔진 (프로세스당 1개)
+_worker_processor: Optional[OCRProcessor] = None
+
+
+def _init_page_worker(config: dict, cpu_slots=None):
+    """ProcessPoolExecutor 초기화 함수: 워커 프로세스 전용 프로세서를 만듭니다."""
+    global _worker_processor
+    
+    # 배정된 CPU 묶음에 고정 (Linux 전용, 배정이 남아있지 않거나 실패하면 그대로 진행)
+    if cpu_slots is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            cpus = cpu_slots.get_nowait()
+            if cpus:
+                os.sched_setaffinity(0, cpus)
+        except (queue.Empty, OSError):
+            pass
+    
+    _worker_processor = OCRProcessor(**config)
+
+
+def _ocr_pdf_page(
+    file_path: str,
+    page_num: int,
+    pdf_dpi: int,
+    confidence_threshold: float,
+    preprocess: bool
+) -> List[OCRResult]:
+    """워커 프로세스에서 PDF 한 페이지를 렌더링하고 인식합니다."""
+    img = convert_pdf_page(file_path, page_num, dpi=pdf_dpi)
+    return _worker_processor.process_image(
+        img,
+        confidence_threshold=confidence_threshold,
+        preprocess=preprocess
+    )
+
+
+def get_cached_processor(
+    lang: str = 'korean',
+    use_angle_cls: bool = True,
+    det: bool = True,
+    rec: bool = True
+) -> OCRProcessor:
+    """설정별로 공유되는 OCR 프로세서 인스턴스를 반환합니다."""
+    key = (lang, use_angle_cls, det, rec)
+    processor = _processor_cache.get(key)
+    if processor is not None:
+        return processor
+    
+    with _processor_cache_lock:
+        processor = _processor_cache.get(key)
+        if processor is None:
+            processor = OCRProcessor(lang=lang, use_angle_cls=use_angle_cls, det=det, rec=rec)
+            _processor_cache[key] = processor
+        return processor
 
 
 def get_default_processor() -> OCRProcessor:
     """기본 OCR 프로세서 인스턴스를 반환합니다."""
-    global _default_processor
-    if _default_processor is None:
-        _default_processor = OCRProcessor()
-    return _default_processor
+    return get_cached_processor()
 
 
 def quick_ocr(file_path: str, lang: str = 'korean') -> str:
@@ -543,6 +1259,5 @@ def quick_ocr(file_path: str, lang: str = 'korean') -> str:
     Returns:
         str: 추출된 텍스트
     """
-    processor = OCRProcessor(lang=lang)
-    return processor.get_text(file_path)
+    return get_cached_processor(lang).get_text(file_path)
 
@@ -5,22 +5,42 @@ parallel_ocr.py - 병렬 OCR 처리 모듈
 ThreadPoolExecutor를 사용하여 효율적인 병렬 처리를 수행합니다.
 """
 
+import asyncio
+import json
 import logging
+import queue
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Callable, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import threading
 
 from dcas_client import DcasClient, PatientInfo, StudyInfo, DcasConnectionError
-from ocr_processor import OCRProcessor, OCRError
+from ocr_processor import OCRProcessor, OCRError, get_cached_processor
+from utils import _DATACLASS_SLOTS, decode_image_bytes
+
+# 비동기 HTTP 클라이언트 (선택사항 - 없으면 스레드 풀로 다운로드)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# 빠른 JSON 직렬화 (선택사항 - 없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 작업 상태 잠금 분할 수 (서로 다른 작업의 상태 조회/갱신이 같은 잠금을 기다리지 않도록)
+JOB_LOCK_STRIPES = 16
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OCRTaskResult:
     """단일 OCR 작업 결과"""
     patient: PatientInfo
@@ -46,7 +66,7 @@ class OCRTaskResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BatchOCRResult:
     """배치 OCR 결과"""
     total: int
@@ -63,15 +83,43 @@ class BatchOCRResult:
             return (self.end_time - self.start_time).total_seconds()
         return 0.0
     
-    def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
+    def _summary_dict(self) -> Dict[str, Any]:
+        """results를 제외한 요약 필드"""
         return {
             "total": self.total,
             "success_count": self.success_count,
             "failure_count": self.failure_count,
             "elapsed_seconds": self.elapsed_seconds,
-            "results": [r.to_dict() for r in self.results]
         }
+    
+    def iter_result_dicts(self):
+        """결과를 하나씩 딕셔너리로 변환하며 순회 (전체 목록을 한 번에 만들지 않음)"""
+        for r in self.results:
+            yield r.to_dict()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        data = self._summary_dict()
+        data["results"] = list(self.iter_result_dicts())
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        to_dict()와 같은 구조의 JSON 바이트로 직렬화합니다.
+        
+        결과 딕셔너리를 하나씩 직렬화해 이어 붙이므로, 대량 배치에서도
+        결과 딕셔너리 목록 전체가 메모리에 동시에 올라가지 않습니다.
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj):
+                return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        
+        summary = dumps(self._summary_dict())
+        results = b",".join(dumps(d) for d in self.iter_result_dicts())
+        # 요약 객체의 닫는 괄호 앞에 results 배열을 끼워 넣음
+        return summary[:-1] + b',"results":[' + results + b"]}"
 
 
 class ParallelOCRProcessor:
@@ -87,7 +135,12 @@ class ParallelOCRProcessor:
         max_workers: int = 4,  # 이미지 다운로드용 병렬 워커 (OCR은 순차)
         language: str = "korean",
         confidence_threshold: float = 0.3,
-        ocr_processor: Optional[OCRProcessor] = None  # 외부에서 주입 가능
+        ocr_processor: Optional[OCRProcessor] = None,  # 외부에서 주입 가능
+        batch_size: int = 8,
+        batch_wait_ms: int = 50,
+        async_download_limit: int = 32,
+        max_image_size: Optional[int] = 1600,
+        progress_interval: float = 0.1
     ):
         """
         병렬 OCR 처리기 초기화
@@ -97,18 +150,30 @@ class ParallelOCRProcessor:
             max_workers: 이미지 다운로드용 병렬 워커 수
             language: OCR 언어
             confidence_threshold: 신뢰도 임계값
-            ocr_processor: 외부에서 주입할 OCR 프로세서 (None이면 내부 생성)
+            ocr_processor: 외부에서 주입할 OCR 프로세서 (None이면 language별 공유 프로세서 사용)
+            batch_size: 한 번의 OCR 호출로 처리할 최대 이미지 수
+            batch_wait_ms: 배치를 채우기 위해 다운로드를 기다리는 최대 시간 (ms)
+            async_download_limit: aiohttp 사용 시 동시 이미지 다운로드 수 (0이면 aiohttp 미사용)
+            max_image_size: OCR 전 이미지 긴 변의 최대 픽셀 수 (None이면 원본 크기).
+                            리포트 텍스트는 이 크기에서도 충분히 읽히며, 디코딩/OCR 비용이 줄어듭니다.
+            progress_interval: 진행 상황 콜백의 최소 호출 간격 (초). status 변경은 항상 전달됩니다.
         """
         self.dcas_client = dcas_client
         self.max_workers = max_workers
         self.language = language
         self.confidence_threshold = confidence_threshold
+        self.batch_size = max(1, batch_size)
+        self.batch_wait_ms = batch_wait_ms
+        self.async_download_limit = async_download_limit
+        self.max_image_size = max_image_size
+        
+        # 다운로드 워커마다 keep-alive 연결 하나씩 (풀이 부족하면 연결을 버리고 새로 맺음)
+        self.dcas_client.ensure_pool_size(max_workers)
         
         # OCR 프로세서 (외부 주입 또는 내부 생성)
         self._ocr_processor: Optional[OCRProcessor] = ocr_processor
-        self._ocr_lock = threading.Lock()
         
-        # 진행 상황 추적
+        # 진행 상황 추적 (갱신할 때마다 새 dict로 교체 - 게시된 스냅샷은 수정하지 않음)
         self._progress: Dict[str, Any] = {
             "total": 0,
             "completed": 0,
@@ -117,32 +182,47 @@ class ParallelOCRProcessor:
         }
         self._progress_lock = threading.Lock()
         self._progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.progress_interval = progress_interval
+        self._last_progress_callback = 0.0
     
     @property
     def ocr_processor(self) -> OCRProcessor:
-        """OCR 프로세서 인스턴스 (외부 주입 또는 지연 초기화)"""
+        """OCR 프로세서 인스턴스 (외부 주입 또는 language별 공유 프로세서)"""
         if self._ocr_processor is None:
-            logger.warning("⚠️ OCR 프로세서가 주입되지 않아 새로 생성합니다.")
-            self._ocr_processor = OCRProcessor(
-                lang=self.language,
-                confidence_threshold=self.confidence_threshold
-            )
+            # 요청마다 새 처리기를 만들어도 모델은 프로세스당 한 번만 로드
+            # (신뢰도 임계값은 호출마다 전달하므로 캐시 키에 포함하지 않음)
+            # 백그라운드 초기화와 OCR 루프가 동시에 접근해도 캐시 잠금으로 엔진은 한 번만 생성
+            self._ocr_processor = get_cached_processor(self.language)
         return self._ocr_processor
     
+    def _preload_ocr_processor(self):
+        """OCR 엔진을 백그라운드에서 미리 초기화 (실패는 OCR 루프에서 다시 시도/보고)"""
+        try:
+            self.ocr_processor.ensure_initialized()
+        except Exception as e:
+            logger.warning(f"OCR 프로세서 사전 초기화 실패: {e}")
+    
     def set_progress_callback(self, callback: Callable[[Dict[str, Any]], None]):
-        """진행 상황 콜백 설정"""
+        """진행 상황 콜백 설정 (콜백이 받는 dict는 읽기 전용 스냅샷)"""
         self._progress_callback = callback
     
     def get_progress(self) -> Dict[str, Any]:
         """현재 진행 상황 반환"""
-        with self._progress_lock:
-            return self._progress.copy()
+        # 참조 읽기는 원자적이고 게시된 스냅샷은 변경되지 않으므로 잠금 불필요
+        return self._progress.copy()
     
     def _update_progress(self, **kwargs):
         """진행 상황 업데이트"""
+        # 잠금은 갱신끼리만 직렬화 (읽기/콜백은 게시된 스냅샷을 그대로 사용)
         with self._progress_lock:
-            self._progress.update(kwargs)
-            progress = self._progress.copy()
+            progress = {**self._progress, **kwargs}
+            self._progress = progress
+            
+            # 잦은 갱신은 간격 내에서 합쳐 전달 (스냅샷이 누적되므로 다음 콜백에 최신 상태가 담김)
+            now = time.monotonic()
+            if "status" not in kwargs and now - self._last_progress_callback < self.progress_interval:
+                return
+            self._last_progress_callback = now
         
         if self._progress_callback:
             try:
@@ -156,15 +236,10 @@ class ParallelOCRProcessor:
         
         Args:
             patient: 환자 정보
-            
+        
         Returns:
-            Dict: 다운로드 결과 (temp_file, report_url, error 등)
+            Dict: 다운로드 결과 (image: RGB numpy 배열, report_url, error 등)
         """
-        import tempfile
-        import os
-        from PIL import Image
-        from io import BytesIO
-        
         try:
             # 검사 정보 조회
             study_info = self.dcas_client.get_study_info(patient)
@@ -177,30 +252,88 @@ class ParallelOCRProcessor:
                     "error": "리포트 이미지를 찾을 수 없습니다."
                 }
             
-            # 이미지 다운로드
+            # 이미지 다운로드 및 디코딩 (임시 파일 없이 배열로 OCR에 전달)
             print(f"📥 이미지 다운로드: {report_url}")
-            response = self.dcas_client.session.get(report_url, timeout=30)
-            response.raise_for_status()
+            return {
+                "patient": patient,
+                "success": True,
+                "image": self.dcas_client.download_image(
+                    report_url, max_size=self.max_image_size
+                ),
+                "report_url": report_url
+            }
             
-            # PIL로 이미지 로드 후 RGB 변환하여 저장
-            image = Image.open(BytesIO(response.content))
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+        except DcasConnectionError as e:
+            logger.error(f"Dcas 연결 오류 ({patient.patient_id}): {e}")
+            return {
+                "patient": patient,
+                "success": False,
+                "error": f"Dcas 연결 오류: {str(e)}"
+            }
+        except Exception as e:
+            logger.error(f"다운로드 오류 ({patient.patient_id}): {e}")
+            return {
+                "patient": patient,
+                "success": False,
+                "error": f"다운로드 오류: {str(e)}"
+            }
+    
+    async def _download_image_async(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        patient: PatientInfo
+    ) -> Dict[str, Any]:
+        """
+        단일 환자의 리포트 이미지를 aiohttp로 다운로드합니다.
+        
+        검사 정보 조회(requests 세션 사용)와 이미지 디코딩은 executor에서 실행하고,
+        이미지 전송만 공유 aiohttp 세션으로 처리합니다.
+        
+        Args:
+            session: 공유 aiohttp 세션
+            semaphore: 동시 다운로드 수 제한
+            patient: 환자 정보
+        
+        Returns:
+            Dict: 다운로드 결과 (_download_image와 동일한 형식)
+        """
+        loop = asyncio.get_running_loop()
+        
+        try:
+            # 검사 정보 조회
+            study_info = await loop.run_in_executor(None, self.dcas_client.get_study_info, patient)
+            report_url = study_info.get_last_image_url()
             
-            # 임시 파일로 저장
-            temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-            image.save(temp_file.name, 'JPEG', quality=95)
-            temp_file.close()
-            print(f"   ✅ 임시 파일 저장: {temp_file.name}")
+            if not report_url:
+                return {
+                    "patient": patient,
+                    "success": False,
+                    "error": "리포트 이미지를 찾을 수 없습니다."
+                }
+            
+            # 이미지 다운로드 (DCAS 세션 쿠키 공유)
+            logger.debug("📥 이미지 다운로드: %s", report_url)
+            async with semaphore:
+                async with session.get(
+                    report_url,
+                    cookies=self.dcas_client.session.cookies.get_dict()
+                ) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+            
+            image = await loop.run_in_executor(
+                None, decode_image_bytes, content, self.max_image_size
+            )
             
             return {
                 "patient": patient,
                 "success": True,
-                "temp_file": temp_file.name,
+                "image": image,
                 "report_url": report_url
             }
             
-        except DcasConnectionError as e:
+        except (DcasConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Dcas 연결 오류 ({patient.patient_id}): {e}")
             return {
                 "patient": patient,
@@ -215,6 +348,45 @@ class ParallelOCRProcessor:
                 "error": f"다운로드 오류: {str(e)}"
             }
     
+    async def _download_all_async(
+        self,
+        patients: List[PatientInfo],
+        on_result: Callable[[Dict[str, Any]], None],
+        cancelled: Optional[threading.Event] = None
+    ):
+        """
+        모든 환자의 리포트 이미지를 하나의 aiohttp 세션으로 동시에 다운로드합니다.
+        
+        Args:
+            patients: 환자 리스트
+            on_result: 다운로드가 끝날 때마다 결과와 함께 호출되는 콜백.
+                가득 찬 큐를 기다리며 블로킹할 수 있으므로 이벤트 루프 밖의 전용 스레드에서 호출합니다
+                (루프가 멈추면 진행 중인 요청이 ClientTimeout에 걸림).
+            cancelled: 설정되면 아직 시작하지 않은 다운로드를 건너뜀
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.async_download_limit)
+        connector = aiohttp.TCPConnector(limit=self.async_download_limit, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        # 결과 전달은 순서대로 하나씩 (대기 중인 전달은 스레드가 아닌 작업으로 쌓임)
+        deliver_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="OCR-deliver")
+        
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=dict(self.dcas_client.session.headers)
+            ) as session:
+                async def fetch(patient: PatientInfo):
+                    if cancelled is not None and cancelled.is_set():
+                        return
+                    result = await self._download_image_async(session, semaphore, patient)
+                    await loop.run_in_executor(deliver_executor, on_result, result)
+                
+                await asyncio.gather(*(fetch(patient) for patient in patients))
+        finally:
+            deliver_executor.shutdown(wait=False)
+    
     def _perform_ocr(self, download_result: Dict[str, Any]) -> OCRTaskResult:
         """
         다운로드된 이미지에 OCR을 수행합니다. (순차 처리)
@@ -225,11 +397,8 @@ class ParallelOCRProcessor:
         Returns:
             OCRTaskResult: OCR 결과
         """
-        import os
-        
         patient = download_result["patient"]
-        start_time = datetime.now()
-        temp_file = download_result.get("temp_file")
+        start_time = time.perf_counter()
         
         try:
             # 다운로드 실패 시
@@ -243,31 +412,15 @@ class ParallelOCRProcessor:
             self._update_progress(current=f"{patient.patient_id} - OCR 처리 중")
             
             # OCR 처리 (순차적으로 - 락 없이)
-            page_results = self.ocr_processor.process_file(
-                temp_file,
+            results = self.ocr_processor.process_image(
+                download_result["image"],
                 confidence_threshold=self.confidence_threshold
             )
             
             # 결과 변환
-            results = page_results[0].results if page_results else []
-            lines = [
-                {"text": r.text, "confidence": round(r.confidence, 4)}
-                for r in results
-            ]
-            text = "\n".join([r.text for r in results])
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
-            logger.info(f"OCR 완료: {patient.patient_id} - {len(results)}줄, {processing_time:.2f}초")
-            
-            return OCRTaskResult(
-                patient=patient,
-                success=True,
-                text=text,
-                lines=lines,
-                image_url=download_result.get("report_url", ""),
-                processing_time=processing_time
-            )
+            return self._build_task_result(download_result, results, processing_time)
             
         except OCRError as e:
             logger.error(f"OCR 오류 ({patient.patient_id}): {e}")
@@ -275,26 +428,118 @@ class ParallelOCRProcessor:
                 patient=patient,
                 success=False,
                 error=f"OCR 오류: {str(e)}",
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=time.perf_counter() - start_time
             )
         except Exception as e:
-            import traceback
-            error_trace = traceback.format_exc()
-            print(f"\n❌ OCR 오류 ({patient.patient_id}): {e}")
-            print(f"📋 스택 트레이스:\n{error_trace}")
-            return OCRTaskResult(
+            task_result = OCRTaskResult(
                 patient=patient,
                 success=False,
                 error=f"OCR 오류: {str(e)}",
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=time.perf_counter() - start_time
             )
-        finally:
-            # 임시 파일 정리
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
+            # 스택 트레이스는 DEBUG 레벨에서만 포맷 (배치 전체 실패 시 로그 폭주 방지)
+            logger.error(
+                "❌ OCR 오류 (%s): %s", patient.patient_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            return task_result
+    
+    def _build_task_result(
+        self,
+        download_result: Dict[str, Any],
+        results: List[Any],
+        processing_time: float
+    ) -> OCRTaskResult:
+        """OCR 결과(OCRResult 리스트)를 OCRTaskResult로 변환합니다."""
+        patient = download_result["patient"]
+        # 결과를 한 번만 순회하며 lines와 본문 텍스트를 함께 구성
+        lines = []
+        texts = []
+        for r in results:
+            lines.append({"text": r.text, "confidence": round(r.confidence, 4)})
+            texts.append(r.text)
+        text = "\n".join(texts)
+        
+        logger.info(f"OCR 완료: {patient.patient_id} - {len(results)}줄, {processing_time:.2f}초")
+        
+        return OCRTaskResult(
+            patient=patient,
+            success=True,
+            text=text,
+            lines=lines,
+            image_url=download_result.get("report_url", ""),
+            processing_time=processing_time
+        )
+    
+    def _perform_ocr_batch(self, download_results: List[Dict[str, Any]]) -> List[OCRTaskResult]:
+        """
+        다운로드된 여러 이미지를 한 번의 OCR 호출로 처리합니다.
+        
+        다운로드 실패 항목은 개별 실패 결과로 변환하고,
+        배치 OCR이 실패하면 이미지별 OCR로 다시 시도합니다.
+        
+        Args:
+            download_results: 다운로드 결과 리스트
+        
+        Returns:
+            List[OCRTaskResult]: 입력 순서와 동일한 OCR 결과 리스트
+        """
+        ready = [r for r in download_results if r["success"]]
+        if len(ready) <= 1:
+            return [self._perform_ocr(r) for r in download_results]
+        
+        start_time = time.perf_counter()
+        self._update_progress(current=f"OCR 배치 처리 중 ({len(ready)}건)")
+        
+        try:
+            batch_results = self.ocr_processor.process_batch(
+                [r["image"] for r in ready],
+                confidence_threshold=self.confidence_threshold
+            )
+        except Exception as e:
+            # 엔진 초기화 실패(OCRInitError)도 여기서 잡아 이미지별 처리에서 환자별 실패로 기록
+            logger.warning(f"배치 OCR 실패, 이미지별 처리로 전환: {e}")
+            return [self._perform_ocr(r) for r in download_results]
+        
+        # 배치 소요 시간을 이미지 수로 나누어 환자별 처리 시간으로 기록
+        per_item_time = (time.perf_counter() - start_time) / len(ready)
+        ocr_by_download = {id(r): results for r, results in zip(ready, batch_results)}
+        
+        task_results = []
+        for download_result in download_results:
+            if not download_result["success"]:
+                task_results.append(self._perform_ocr(download_result))
+                continue
+            
+            task_results.append(self._build_task_result(
+                download_result,
+                ocr_by_download[id(download_result)],
+                per_item_time
+            ))
+        
+        return task_results
+    
+    def _next_ocr_batch(self, download_queue: "queue.Queue", remaining: int) -> List[Dict[str, Any]]:
+        """
+        다운로드 큐에서 다음 OCR 배치를 꺼냅니다.
+        
+        첫 항목은 도착할 때까지 기다리고, 이후 batch_size 또는
+        batch_wait_ms 중 먼저 도달하는 시점까지 추가 항목을 모읍니다.
+        """
+        batch = [download_queue.get()]
+        limit = min(self.batch_size, remaining)
+        deadline = time.monotonic() + self.batch_wait_ms / 1000
+        
+        while len(batch) < limit:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(download_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        
+        return batch
     
     def process_patients(
         self,
@@ -304,7 +549,10 @@ class ParallelOCRProcessor:
         """
         여러 환자의 리포트를 처리합니다.
         - 이미지 다운로드: 병렬 (빠른 네트워크 I/O)
-        - OCR 처리: 순차 (PaddleOCR 충돌 방지)
+        - OCR 처리: 다운로드가 끝나는 대로 마이크로 배치 단위로 순차 처리
+          (batch_size 또는 batch_wait_ms 중 먼저 도달하는 시점에 실행, PaddleOCR 충돌 방지)
+        - 다운로드가 OCR보다 앞서 나가도 대기 중인 이미지는 워커당 2개
+          (최소 batch_size개)까지만 쌓이고, 그 이상은 다운로드가 OCR을 기다립니다.
         
         Args:
             patients: 환자 리스트
@@ -331,51 +579,116 @@ class ParallelOCRProcessor:
         )
         
         start_time = datetime.now()
-        results: List[OCRTaskResult] = []
+        # 환자 수만큼 미리 할당 (완료 순서대로 채움)
+        results: List[OCRTaskResult] = [None] * len(patients)
+        completed = 0
         success_count = 0
         failure_count = 0
         
-        logger.info(f"처리 시작: {len(patients)}명 (다운로드: 병렬 {self.max_workers}개, OCR: 순차)")
+        logger.info(
+            f"처리 시작: {len(patients)}명 (다운로드: 병렬 {self.max_workers}개, "
+            f"OCR: 배치 최대 {self.batch_size}개/{self.batch_wait_ms}ms)"
+        )
         
-        # 1단계: 이미지 다운로드 (병렬)
-        download_results: List[Dict[str, Any]] = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_patient = {
-                executor.submit(self._download_image, patient): patient
-                for patient in patients
-            }
-            
-            for future in as_completed(future_to_patient):
-                download_result = future.result()
-                download_results.append(download_result)
-                self._update_progress(
-                    current=f"다운로드 완료: {len(download_results)}/{len(patients)}"
-                )
+        # 다운로드 완료 순서대로 결과를 받는 큐 (선행 다운로드 수 제한으로 디코딩된 이미지 메모리 상한)
+        prefetch_depth = max(2 * self.max_workers, self.batch_size)
+        download_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=prefetch_depth)
+        # OCR 루프가 (예외 등으로) 끝났음을 알리는 이벤트 - 가득 찬 큐에서 다운로드가 영원히 멈추지 않도록
+        consumer_done = threading.Event()
         
-        logger.info(f"이미지 다운로드 완료: {len(download_results)}개")
+        def put_download(download_result: Dict[str, Any]) -> bool:
+            while not consumer_done.is_set():
+                try:
+                    download_queue.put(download_result, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        # 2단계: OCR 처리 (순차)
-        self._update_progress(current="OCR 처리 중...")
+        def enqueue_download(patient: PatientInfo):
+            if consumer_done.is_set():
+                return
+            try:
+                put_download(self._download_image(patient))
+            except Exception as e:
+                # 큐에 항목이 빠지면 OCR 루프가 멈추므로 반드시 실패 결과를 넣음
+                put_download({
+                    "patient": patient,
+                    "success": False,
+                    "error": f"다운로드 오류: {str(e)}"
+                })
         
-        for i, download_result in enumerate(download_results):
-            result = self._perform_ocr(download_result)
-            results.append(result)
+        def download_all_async():
+            delivered = set()
             
-            if result.success:
-                success_count += 1
-            else:
-                failure_count += 1
+            def deliver(download_result: Dict[str, Any]):
+                delivered.add(id(download_result["patient"]))
+                put_download(download_result)
             
-            self._update_progress(
-                completed=i + 1,
-                current=f"OCR 완료: {result.patient.patient_id}"
-            )
+            try:
+                asyncio.run(self._download_all_async(patients, deliver, consumer_done))
+            except Exception as e:
+                logger.error(f"비동기 다운로드 오류: {e}")
+                # 결과를 받지 못한 환자는 실패로 채워 OCR 루프가 멈추지 않게 함
+                for patient in patients:
+                    if id(patient) not in delivered:
+                        if not put_download({
+                            "patient": patient,
+                            "success": False,
+                            "error": f"다운로드 오류: {str(e)}"
+                        }):
+                            break
+        
+        use_async_download = aiohttp is not None and self.async_download_limit > 0
+        
+        # 다운로드와 동시에 엔진을 초기화해 첫 배치의 모델 로드 지연을 숨김
+        # (주입된 프로세서도 아직 초기화되지 않았을 수 있음 - 이미 초기화되었으면 즉시 종료)
+        threading.Thread(
+            target=self._preload_ocr_processor,
+            daemon=True,
+            name="OCR-init"
+        ).start()
+        
+        # 1단계 (백그라운드): 이미지 다운로드 (aiohttp 또는 스레드 풀로 병렬)
+        # 2단계 (현재 스레드): 다운로드된 이미지를 배치로 모아 OCR 처리 (순차)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if use_async_download:
+                download_thread = threading.Thread(
+                    target=download_all_async,
+                    daemon=True,
+                    name="OCR-download"
+                )
+                download_thread.start()
+            else:
+                for patient in patients:
+                    executor.submit(enqueue_download, patient)
             
-            if on_complete:
-                try:
-                    on_complete(result)
-                except Exception as e:
-                    logger.warning(f"완료 콜백 오류: {e}")
+            try:
+                while completed < len(patients):
+                    batch = self._next_ocr_batch(download_queue, len(patients) - completed)
+                    
+                    for result in self._perform_ocr_batch(batch):
+                        results[completed] = result
+                        completed += 1
+                        
+                        if result.success:
+                            success_count += 1
+                        else:
+                            failure_count += 1
+                        
+                        self._update_progress(
+                            completed=completed,
+                            current=f"OCR 완료: {result.patient.patient_id}"
+                        )
+                        
+                        if on_complete:
+                            try:
+                                on_complete(result)
+                            except Exception as e:
+                                logger.warning(f"완료 콜백 오류: {e}")
+            finally:
+                # 예외로 빠져나가도 대기 중인 다운로드가 풀리고 남은 작업은 건너뛰어 executor 종료가 멈추지 않음
+                consumer_done.set()
         
         end_time = datetime.now()
         
@@ -431,15 +744,31 @@ class OCRJobManager:
     OCR 작업 관리자
     
     비동기 OCR 작업을 관리하고 상태를 추적합니다.
+    
+    작업 상태는 copy-on-write 스냅샷입니다. 갱신은 job_id로 나눈 잠금 아래에서 새 dict를
+    만들어 교체하고, 조회는 잠금/복사 없이 현재 스냅샷을 그대로 반환합니다.
+    반환된 dict는 다른 호출자와 공유되므로 수정하면 안 됩니다.
+    작업 등록/삭제/목록은 생성 순서를 유지하는 _lock으로 보호합니다.
     """
     
-    def __init__(self):
+    def __init__(self, max_results: int = 10000):
+        """
+        Args:
+            max_results: 작업당 보관할 최대 결과 수 (초과 시 오래된 결과부터 제거)
+        """
+        # 생성 순서 유지 (목록 페이지 순서)
         self._jobs: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
+        self._stripe_locks = [threading.Lock() for _ in range(JOB_LOCK_STRIPES)]
+        self.max_results = max_results
+    
+    def _job_lock(self, job_id: str) -> threading.Lock:
+        """작업 내용을 보호하는 분할 잠금"""
+        return self._stripe_locks[hash(job_id) % len(self._stripe_locks)]
     
     def create_job(self, job_id: str, total: int) -> Dict[str, Any]:
         """새 작업 생성"""
-        with self._lock:
+        with self._lock, self._job_lock(job_id):
             self._jobs[job_id] = {
                 "id": job_id,
                 "status": "pending",
@@ -453,35 +782,91 @@ class OCRJobManager:
                 "started_at": None,
                 "finished_at": None
             }
-            return self._jobs[job_id].copy()
+            return self._jobs[job_id]
     
     def update_job(self, job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
         """작업 상태 업데이트"""
-        with self._lock:
-            if job_id in self._jobs:
-                self._jobs[job_id].update(kwargs)
-                return self._jobs[job_id].copy()
-        return None
+        with self._job_lock(job_id):
+            # 잠금 안에서 다시 조회해야 동시 갱신/삭제된 작업을 덮어쓰지 않음
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job = self._jobs[job_id] = {**job, **kwargs}
+            return job
+    
+    def add_result(self, job_id: str, result: Dict[str, Any], success: bool) -> bool:
+        """
+        작업에 처리 결과를 추가하고 성공/실패 수를 갱신합니다.
+        
+        결과가 max_results를 넘으면 가장 오래된 결과부터 제거합니다.
+        결과 목록은 복사하지 않고 제자리에서 추가합니다 (스냅샷 간 공유).
+        """
+        with self._job_lock(job_id):
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            results = job["results"]
+            results.append(result)
+            if len(results) > self.max_results:
+                del results[:len(results) - self.max_results]
+            key = "success" if success else "failure"
+            self._jobs[job_id] = {**job, key: job[key] + 1}
+            return True
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 상태 조회"""
-        with self._lock:
-            if job_id in self._jobs:
-                return self._jobs[job_id].copy()
-        return None
+        """작업 상태 조회 (읽기 전용 스냅샷)"""
+        return self._jobs.get(job_id)
     
     def delete_job(self, job_id: str) -> bool:
         """작업 삭제"""
-        with self._lock:
+        with self._lock, self._job_lock(job_id):
             if job_id in self._jobs:
                 del self._jobs[job_id]
                 return True
         return False
     
     def list_jobs(self) -> List[Dict[str, Any]]:
-        """모든 작업 목록"""
+        """모든 작업 목록 (읽기 전용 스냅샷)"""
+        with self._lock:
+            return list(self._jobs.values())
+    
+    def list_job_summaries(self, offset: int = 0, limit: int = 50) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        작업 요약 목록 (results 제외, 페이지 단위)
+        
+        Returns:
+            (전체 작업 수, 요약 목록) - 요약에는 results 대신 result_count가 포함됩니다.
+        """
         with self._lock:
-            return [job.copy() for job in self._jobs.values()]
+            jobs = list(self._jobs.values())
+        
+        page = [
+            {
+                **{k: v for k, v in job.items() if k != "results"},
+                "result_count": len(job["results"])
+            }
+            for job in jobs[offset:offset + limit]
+        ]
+        return len(jobs), page
+    
+    def get_job_results(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = 50
+    ) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        작업 결과 조회 (페이지 단위)
+        
+        Returns:
+            (전체 결과 수, 결과 목록), 작업이 없으면 None
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        with self._job_lock(job_id):
+            results = job["results"]
+            return len(results), results[offset:offset + limit]
 
 
 # 전역 작업 관리자
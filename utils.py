@@ -8,11 +8,14 @@ utils.py - 파일 처리 및 텍스트 정제 유틸리티 모듈
 - 텍스트 정제 및 파싱
 """
 
+import functools
 import os
-import re
+import stat
+import sys
 import tempfile
-from pathlib import Path
-from typing import List, Optional, Tuple, Union
+import threading
+from io import BytesIO
+from typing import Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -24,6 +27,27 @@ SUPPORTED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif',
 SUPPORTED_PDF_EXTENSION = '.pdf'
 ALL_SUPPORTED_EXTENSIONS = SUPPORTED_IMAGE_EXTENSIONS | {SUPPORTED_PDF_EXTENSION}
 
+# OpenCV(libjpeg-turbo/libpng)로 먼저 디코딩할 확장자 (나머지는 PIL)
+_OPENCV_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp'}
+
+# 파일 시그니처 (매직 바이트) -> 대표 확장자 (WEBP는 RIFF 컨테이너라 별도 확인)
+_FILE_SIGNATURES = (
+    (b'%PDF-', '.pdf'),
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'BM', '.bmp'),
+    (b'II*\x00', '.tiff'),
+    (b'MM\x00*', '.tiff'),
+)
+_FILE_SIGNATURE_SIZE = 16
+
+# Python 3.10+에서는 __slots__ 데이터클래스 사용 (결과/환자 객체가 대량 생성되므로 인스턴스 __dict__ 제거)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# 스레드별 CLAHE 객체 (내부 작업 버퍼를 가지므로 스레드 간 공유하지 않음)
+_clahe_local = threading.local()
+
 
 class FileValidationError(Exception):
     """파일 유효성 검사 실패 예외"""
@@ -40,6 +64,39 @@ class PDFProcessingError(Exception):
     pass
 
 
+def _file_ext(file_path: str) -> str:
+    """소문자 확장자 ('.pdf' 등) - Path 객체를 만들지 않는 os.path.splitext 사용"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _sniff_file_type(head: bytes) -> Optional[str]:
+    """파일 앞부분 바이트로 실제 형식의 대표 확장자를 판별합니다 (알 수 없으면 None)."""
+    for signature, ext in _FILE_SIGNATURES:
+        if head.startswith(signature):
+            return ext
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return '.webp'
+    return None
+
+
+def detect_file_type(file_path: str) -> Optional[str]:
+    """
+    확장자 대신 파일 헤더(매직 바이트)로 형식을 판별합니다.
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        Optional[str]: 대표 확장자 ('.pdf', '.png', '.jpg', '.bmp', '.tiff', '.webp'),
+            읽을 수 없거나 알 수 없는 형식이면 None
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return _sniff_file_type(f.read(_FILE_SIGNATURE_SIZE))
+    except OSError:
+        return None
+
+
 def validate_file(file_path: str) -> Tuple[bool, str]:
     """
     파일 유효성을 검사합니다.
@@ -53,69 +110,101 @@ def validate_file(file_path: str) -> Tuple[bool, str]:
     if not file_path:
         return False, "파일 경로가 비어있습니다."
     
-    path = Path(file_path)
-    
-    # 파일 존재 여부 확인
-    if not path.exists():
+    # 존재 여부/파일 종류/크기를 한 번의 stat 호출로 확인
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
         return False, f"파일을 찾을 수 없습니다: {file_path}"
     
     # 파일 여부 확인 (디렉토리가 아닌지)
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         return False, f"유효한 파일이 아닙니다: {file_path}"
     
     # 확장자 확인
-    ext = path.suffix.lower()
+    ext = _file_ext(file_path)
     if ext not in ALL_SUPPORTED_EXTENSIONS:
         supported = ', '.join(sorted(ALL_SUPPORTED_EXTENSIONS))
         return False, f"지원하지 않는 파일 형식입니다: {ext}\n지원 형식: {supported}"
     
     # 파일 크기 확인 (0바이트 파일 체크)
-    if path.stat().st_size == 0:
+    if file_stat.st_size == 0:
         return False, "파일이 비어있습니다."
     
+    # 내용 확인 - PDF/이미지가 확장자와 반대로 붙은 파일은 디코딩 전에 거부
+    # (알 수 없는 시그니처는 디코더 판단에 맡김)
+    detected = detect_file_type(file_path)
+    if detected is not None and (detected == SUPPORTED_PDF_EXTENSION) != (ext == SUPPORTED_PDF_EXTENSION):
+        return False, f"파일 내용({detected})이 확장자({ext})와 일치하지 않습니다."
+    
     return True, "유효한 파일입니다."
 
 
 def is_pdf_file(file_path: str) -> bool:
     """PDF 파일 여부를 확인합니다."""
-    return Path(file_path).suffix.lower() == SUPPORTED_PDF_EXTENSION
+    return _file_ext(file_path) == SUPPORTED_PDF_EXTENSION
 
 
 def is_image_file(file_path: str) -> bool:
     """이미지 파일 여부를 확인합니다."""
-    return Path(file_path).suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
+    return _file_ext(file_path) in SUPPORTED_IMAGE_EXTENSIONS
 
 
-def load_image(file_path: str) -> np.ndarray:
+def load_image(file_path: str, copy: bool = False) -> np.ndarray:
     """
     이미지 파일을 로드합니다.
     
     Args:
         file_path: 이미지 파일 경로
+        copy: True면 쓰기 가능한 배열을 반환합니다.
+            False(기본값)면 디코더와 관계없이 읽기 전용 배열을 반환하며, PIL로 디코딩하는
+            형식(TIFF/WEBP 등)은 추가 복사를 하지 않습니다. OCR/전처리 입력처럼
+            수정하지 않는 경우에 적합합니다 (OCRProcessor는 엔진에 넘기기 전에 복사).
         
     Returns:
-        np.ndarray: RGB 형식의 이미지 배열
+        np.ndarray: RGB 형식의 이미지 배열 (copy=False면 읽기 전용)
         
     Raises:
         ImageProcessingError: 이미지 로드 실패 시
     """
+    image = _decode_image_file(file_path, copy)
+    if not copy:
+        image.setflags(write=False)
+    return image
+
+
+def _decode_image_file(file_path: str, copy: bool) -> np.ndarray:
+    """load_image의 디코딩 단계 (copy=False면 PIL 경로는 읽기 전용 배열을 반환)"""
+    # 디코더는 확장자가 아니라 헤더로 선택 (확장자가 잘못 붙은 파일도 한 번에 디코딩)
+    file_type = detect_file_type(file_path)
+    if file_type == SUPPORTED_PDF_EXTENSION:
+        raise ImageProcessingError(f"PDF 파일은 이미지로 로드할 수 없습니다: {file_path}")
+    
+    if file_type in _OPENCV_IMAGE_EXTENSIONS:
+        # 흔한 형식은 OpenCV로 바로 디코딩 (JPEG 기준 PIL보다 2배 이상 빠름, 알파 합성 결과 동일)
+        # cv2.imread 대신 바이트를 읽어 넘기면 Windows 유니코드 경로도 처리됨
+        try:
+            with open(file_path, 'rb') as f:
+                return decode_image_bytes(f.read())
+        except (OSError, ImageProcessingError):
+            pass  # PIL로 재시도
+    
     try:
-        # PIL로 먼저 시도 (더 넓은 포맷 지원)
+        # PIL로 시도 (더 넓은 포맷 지원)
         pil_image = Image.open(file_path)
         
         # RGBA -> RGB 변환 (필요한 경우)
         if pil_image.mode == 'RGBA':
-            # 흰색 배경으로 알파 채널 합성
+            # 흰색 배경으로 알파 채널 합성 (RGBA 마스크는 알파 채널을 바로 사용 - split() 복사 없음)
             background = Image.new('RGB', pil_image.size, (255, 255, 255))
-            background.paste(pil_image, mask=pil_image.split()[3])
+            background.paste(pil_image, mask=pil_image)
             pil_image = background
         elif pil_image.mode != 'RGB':
             pil_image = pil_image.convert('RGB')
         
-        # numpy 배열로 변환
-        image_array = np.array(pil_image)
-        
-        return image_array
+        # numpy 배열로 변환 (읽기 전용 배열은 PIL 버퍼를 한 번만 복사)
+        if copy:
+            return np.array(pil_image)
+        return _pil_to_rgb_array(pil_image)
         
     except Exception as e:
         # OpenCV로 재시도
@@ -130,93 +219,315 @@ def load_image(file_path: str) -> np.ndarray:
             raise ImageProcessingError(f"이미지 로드 실패: {str(e)}, OpenCV 시도: {str(cv_e)}")
 
 
-def convert_pdf_to_images(pdf_path: str, dpi: int = 200) -> List[np.ndarray]:
+def _composite_on_white(color: np.ndarray, alpha: np.ndarray) -> np.ndarray:
     """
-    PDF 파일을 이미지 리스트로 변환합니다.
+    3채널 이미지를 알파 채널로 흰색 배경에 합성합니다 (load_image의 PIL paste와 동일한 결과).
+    
+    color*a + 255*(255-a) = 255*255 - (255-color)*a 이므로 uint8 연산 세 번으로 끝납니다.
     
     Args:
-        pdf_path: PDF 파일 경로
-        dpi: 변환 해상도 (기본값: 200)
-        
+        color: (H, W, 3) uint8 이미지
+        alpha: (H, W) uint8 알파 채널
+    
     Returns:
-        List[np.ndarray]: RGB 형식의 이미지 배열 리스트
-        
+        np.ndarray: 합성된 (H, W, 3) uint8 이미지 (새 배열)
+    """
+    inverted = cv2.bitwise_not(color)
+    cv2.multiply(inverted, cv2.cvtColor(alpha, cv2.COLOR_GRAY2BGR), dst=inverted, scale=1 / 255)
+    return cv2.bitwise_not(inverted, dst=inverted)
+
+
+def _fit_size(size: Tuple[int, int], max_size: Optional[int]) -> Optional[Tuple[int, int]]:
+    """
+    긴 변이 max_size를 넘지 않도록 비율을 유지한 (width, height)를 계산합니다.
+    
+    Args:
+        size: 원본 (width, height)
+        max_size: 긴 변의 최대 픽셀 수 (None/0이면 제한 없음)
+    
+    Returns:
+        축소할 크기, 축소가 필요 없으면 None
+    """
+    width, height = size
+    longest = max(width, height)
+    if not max_size or longest <= max_size:
+        return None
+    ratio = max_size / longest
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def resize_to_fit(image: np.ndarray, max_size: Optional[int]) -> np.ndarray:
+    """
+    긴 변이 max_size를 넘는 이미지를 비율을 유지하며 축소합니다.
+    
+    Args:
+        image: 이미지 배열
+        max_size: 긴 변의 최대 픽셀 수 (None/0이면 그대로 반환)
+    
+    Returns:
+        np.ndarray: 축소된 이미지 (축소가 필요 없으면 입력 그대로)
+    """
+    target = _fit_size((image.shape[1], image.shape[0]), max_size)
+    if target is None:
+        return image
+    # 축소에는 INTER_AREA가 모아레/계단 현상 없이 가장 깨끗함
+    return cv2.resize(image, target, interpolation=cv2.INTER_AREA)
+
+
+def _jpeg_reduce_flag(data: bytes, max_size: int) -> int:
+    """
+    JPEG를 DCT 단계에서 1/2~1/8로 줄여 디코딩할 imdecode 플래그를 고릅니다.
+    
+    줄인 결과의 긴 변이 max_size 이상으로 남는 가장 큰 배율을 선택하며,
+    JPEG가 아니거나 헤더를 읽을 수 없으면 IMREAD_UNCHANGED를 반환합니다.
+    """
+    try:
+        with Image.open(BytesIO(data)) as header:
+            # 헤더만 파싱 (픽셀 디코딩 없음)
+            if header.format != 'JPEG':
+                return cv2.IMREAD_UNCHANGED
+            longest = max(header.size)
+    except Exception:
+        return cv2.IMREAD_UNCHANGED
+    
+    for scale, flag in ((8, cv2.IMREAD_REDUCED_COLOR_8),
+                        (4, cv2.IMREAD_REDUCED_COLOR_4),
+                        (2, cv2.IMREAD_REDUCED_COLOR_2)):
+        if longest // scale >= max_size:
+            return flag
+    return cv2.IMREAD_UNCHANGED
+
+
+def decode_image_bytes(data: bytes, max_size: Optional[int] = None) -> np.ndarray:
+    """
+    메모리의 이미지 바이트를 디스크를 거치지 않고 디코딩합니다.
+    
+    Args:
+        data: 인코딩된 이미지 바이트 (PNG, JPEG 등)
+        max_size: 긴 변의 최대 픽셀 수 (None이면 원본 크기).
+                  JPEG는 DCT 단계에서 먼저 줄여 디코딩하므로 전체 해상도를 만들지 않습니다.
+    
+    Returns:
+        np.ndarray: RGB 형식의 이미지 배열
+    
     Raises:
-        PDFProcessingError: PDF 변환 실패 시
+        ImageProcessingError: 이미지 디코딩 실패 시
     """
+    if not data:
+        raise ImageProcessingError("이미지 데이터가 비어있습니다.")
+    
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    flag = _jpeg_reduce_flag(data, max_size) if max_size else cv2.IMREAD_UNCHANGED
+    image = cv2.imdecode(buffer, flag)
+    
+    if image is None:
+        raise ImageProcessingError("이미지를 디코딩할 수 없습니다.")
+    
+    # 8비트가 아닌 이미지 (16비트 TIFF/PNG 등)는 8비트 컬러로 다시 디코딩
+    if image.dtype != np.uint8:
+        image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    
+    image = resize_to_fit(image, max_size)
+    
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+    
+    if image.shape[2] == 4:
+        # 흰색 배경으로 알파 채널 합성 (load_image와 동일)
+        image = _composite_on_white(image[:, :, :3], image[:, :, 3])
+    
+    # BGR -> RGB 변환
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def _import_pdf2image():
+    """pdf2image 모듈을 지연 임포트합니다."""
     try:
-        from pdf2image import convert_from_path
-        from pdf2image.exceptions import PDFPageCountError, PDFSyntaxError
+        import pdf2image
+        return pdf2image
     except ImportError:
         raise PDFProcessingError(
             "pdf2image 라이브러리가 설치되지 않았습니다.\n"
             "'pip install pdf2image' 명령으로 설치해주세요.\n"
             "또한 poppler가 시스템에 설치되어 있어야 합니다."
         )
+
+
+def _to_pdf_processing_error(e: Exception) -> PDFProcessingError:
+    """pdf2image/poppler 예외를 PDFProcessingError로 변환합니다."""
+    from pdf2image.exceptions import PDFPageCountError, PDFSyntaxError
+    
+    if isinstance(e, PDFProcessingError):
+        return e
+    if isinstance(e, PDFPageCountError):
+        return PDFProcessingError("PDF 페이지 수를 확인할 수 없습니다. 파일이 손상되었을 수 있습니다.")
+    if isinstance(e, PDFSyntaxError):
+        return PDFProcessingError("PDF 구문 오류가 있습니다. 파일이 손상되었거나 암호화되어 있을 수 있습니다.")
+    if "poppler" in str(e).lower():
+        return PDFProcessingError(
+            "Poppler가 설치되지 않았거나 PATH에 추가되지 않았습니다.\n"
+            "Windows: https://github.com/oschwartz10612/poppler-windows/releases 에서 다운로드 후 PATH에 추가\n"
+            "설치 후 프로그램을 재시작해주세요."
+        )
+    return PDFProcessingError(f"PDF 변환 중 오류 발생: {str(e)}")
+
+
+def _pil_to_rgb_array(pil_image: Image.Image) -> np.ndarray:
+    """PIL 이미지를 RGB 배열로 변환합니다 (PIL 버퍼를 한 번만 복사한 읽기 전용 배열)."""
+    if pil_image.mode != 'RGB':
+        pil_image = pil_image.convert('RGB')
+    # np.array(pil_image)는 tobytes 후 한 번 더 복사
+    width, height = pil_image.size
+    return np.frombuffer(pil_image.tobytes(), dtype=np.uint8).reshape(height, width, 3)
+
+
+def convert_pdf_to_images(pdf_path: str, dpi: int = 200) -> List[np.ndarray]:
+    """
+    PDF 파일을 이미지 리스트로 변환합니다.
+    
+    모든 페이지를 한 번에 메모리에 올리므로 페이지가 많은 PDF는
+    iter_pdf_images를 사용하세요.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        dpi: 변환 해상도 (기본값: 200)
+        
+    Returns:
+        List[np.ndarray]: RGB 형식의 이미지 배열 리스트 (읽기 전용 - 수정하려면 .copy() 사용)
+        
+    Raises:
+        PDFProcessingError: PDF 변환 실패 시
+    """
+    pdf2image = _import_pdf2image()
     
     try:
         # PDF를 이미지로 변환
-        pil_images = convert_from_path(pdf_path, dpi=dpi)
+        pil_images = pdf2image.convert_from_path(pdf_path, dpi=dpi)
         
         if not pil_images:
             raise PDFProcessingError("PDF에서 이미지를 추출할 수 없습니다.")
         
         # numpy 배열로 변환
-        images = []
-        for pil_image in pil_images:
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            images.append(np.array(pil_image))
-        
-        return images
+        return [_pil_to_rgb_array(pil_image) for pil_image in pil_images]
         
-    except PDFPageCountError:
-        raise PDFProcessingError("PDF 페이지 수를 확인할 수 없습니다. 파일이 손상되었을 수 있습니다.")
-    except PDFSyntaxError:
-        raise PDFProcessingError("PDF 구문 오류가 있습니다. 파일이 손상되었거나 암호화되어 있을 수 있습니다.")
     except Exception as e:
-        if "poppler" in str(e).lower():
-            raise PDFProcessingError(
-                "Poppler가 설치되지 않았거나 PATH에 추가되지 않았습니다.\n"
-                "Windows: https://github.com/oschwartz10612/poppler-windows/releases 에서 다운로드 후 PATH에 추가\n"
-                "설치 후 프로그램을 재시작해주세요."
-            )
-        raise PDFProcessingError(f"PDF 변환 중 오류 발생: {str(e)}")
+        raise _to_pdf_processing_error(e)
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    """
+    PDF 파일의 페이지 수를 반환합니다.
+    
+    Raises:
+        PDFProcessingError: 페이지 수 확인 실패 시
+    """
+    pdf2image = _import_pdf2image()
+    
+    try:
+        page_count = int(pdf2image.pdfinfo_from_path(pdf_path).get("Pages", 0))
+    except Exception as e:
+        raise _to_pdf_processing_error(e)
+    
+    if page_count <= 0:
+        raise PDFProcessingError("PDF에서 이미지를 추출할 수 없습니다.")
+    return page_count
+
+
+def convert_pdf_page(pdf_path: str, page_num: int, dpi: int = 200) -> np.ndarray:
+    """
+    PDF의 한 페이지(1부터 시작)만 이미지로 변환합니다.
+    
+    Returns:
+        np.ndarray: RGB 형식의 이미지 배열 (읽기 전용 - 수정하려면 .copy() 사용)
+    
+    Raises:
+        PDFProcessingError: PDF 변환 실패 시
+    """
+    pdf2image = _import_pdf2image()
+    
+    try:
+        pil_images = pdf2image.convert_from_path(
+            pdf_path, dpi=dpi, first_page=page_num, last_page=page_num
+        )
+    except Exception as e:
+        raise _to_pdf_processing_error(e)
+    
+    if not pil_images:
+        raise PDFProcessingError(f"PDF {page_num}페이지에서 이미지를 추출할 수 없습니다.")
+    return _pil_to_rgb_array(pil_images[0])
+
+
+def iter_pdf_images(
+    pdf_path: str,
+    dpi: int = 200,
+    page_count: Optional[int] = None
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    PDF 파일을 한 페이지씩 이미지로 변환하여 (페이지 번호, 이미지)를 순서대로 생성합니다.
+    
+    convert_pdf_to_images와 달리 전체 페이지를 메모리에 올리지 않으므로
+    변환과 OCR을 파이프라인으로 겹쳐 실행할 수 있습니다.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        dpi: 변환 해상도 (기본값: 200)
+        page_count: 페이지 수 (None이면 pdfinfo로 조회)
+    
+    Raises:
+        PDFProcessingError: PDF 변환 실패 시
+    """
+    if page_count is None:
+        page_count = get_pdf_page_count(pdf_path)
+    
+    for page_num in range(1, page_count + 1):
+        yield page_num, convert_pdf_page(pdf_path, page_num, dpi=dpi)
 
 
-def preprocess_image(image: np.ndarray, enhance: bool = True) -> np.ndarray:
+def preprocess_image(
+    image: np.ndarray,
+    enhance: bool = True,
+    out: Optional[np.ndarray] = None,
+    max_dim: Optional[int] = None
+) -> np.ndarray:
     """
     OCR 성능 향상을 위한 이미지 전처리를 수행합니다.
     
     Args:
         image: 입력 이미지 (RGB 형식)
         enhance: 이미지 향상 적용 여부
+        out: 결과를 기록할 버퍼 (image와 같은 shape/dtype, None이면 새로 할당)
+            호출 간에 재사용하면 페이지마다 결과 배열을 할당하지 않습니다.
+        max_dim: 긴 변의 최대 픽셀 수 (None이면 원본 크기). 고해상도 스캔을 필터링 전에
+            INTER_AREA로 축소합니다. 축소되면 OCR 좌표도 축소된 이미지 기준이 됩니다.
         
     Returns:
-        np.ndarray: 전처리된 이미지
+        np.ndarray: 전처리된 이미지 (out을 지정했으면 out).
+            대비 향상은 밝기만 사용하므로 결과는 R=G=B인 3채널 그레이스케일입니다.
     """
+    if max_dim:
+        image = resize_to_fit(image, max_dim)
+    
     if not enhance:
         return image
     
+    if out is not None and (out.shape != image.shape or out.dtype != image.dtype):
+        out = None
+    
     try:
-        # RGB -> BGR (OpenCV 처리용)
-        img = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        # OCR은 밝기만 사용하므로 단일 채널로 줄인 뒤 처리 (3채널 대비 1/3 메모리 패스)
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
         
         # 노이즈 제거 (가벼운 블러)
-        img = cv2.GaussianBlur(img, (3, 3), 0)
+        cv2.GaussianBlur(gray, (3, 3), 0, dst=gray)
         
-        # 대비 향상 (CLAHE)
-        lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-        l, a, b = cv2.split(lab)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        l = clahe.apply(l)
-        lab = cv2.merge([l, a, b])
-        img = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+        # 대비 향상 (CLAHE) - 제자리 변환
+        clahe = getattr(_clahe_local, "clahe", None)
+        if clahe is None:
+            clahe = _clahe_local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        clahe.apply(gray, gray)
         
-        # BGR -> RGB
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        
-        return img
+        # OCR 엔진 입력 형식(3채널)으로 복원
+        return cv2.cvtColor(gray, cv2.COLOR_GRAY2RGB, dst=out)
         
     except Exception:
         # 전처리 실패 시 원본 반환
@@ -236,11 +547,9 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 앞뒤 공백 제거
-    text = text.strip()
-    
-    # 연속된 공백을 단일 공백으로
-    text = re.sub(r'\s+', ' ', text)
+    # 앞뒤 공백 제거 + 연속된 공백을 단일 공백으로
+    # (str.split()의 공백 문자 집합은 정규식 \s와 동일하며 re.sub보다 빠름)
+    text = ' '.join(text.split())
     
     # 불필요한 특수문자 정제 (필요에 따라 조정)
     # 여기서는 기본적인 정제만 수행
@@ -248,6 +557,26 @@ def clean_text(text: str) -> str:
     return text
 
 
+def _filter_lines(results: List[Tuple[str, float]],
+                  confidence_threshold: float,
+                  clean: bool) -> Iterator[Tuple[str, float]]:
+    """신뢰도/빈 텍스트 필터링을 거친 (텍스트, 반올림한 신뢰도) 쌍을 생성합니다."""
+    for text, confidence in results:
+        # 신뢰도 필터링
+        if confidence < confidence_threshold:
+            continue
+        
+        # 텍스트 정제
+        if clean:
+            text = clean_text(text)
+        
+        # 빈 텍스트 제외
+        if not text:
+            continue
+        
+        yield text, round(confidence, 4)
+
+
 def parse_lines(results: List[Tuple[str, float]], 
                 confidence_threshold: float = 0.3,
                 clean: bool = True) -> List[dict]:
@@ -258,56 +587,76 @@ def parse_lines(results: List[Tuple[str, float]],
         results: OCR 결과 리스트 [(텍스트, 신뢰도), ...]
         confidence_threshold: 최소 신뢰도 임계값
         clean: 텍스트 정제 적용 여부
-        
+    
     Returns:
         List[dict]: 파싱된 결과 [{"text": str, "confidence": float}, ...]
     """
-    parsed = []
+    return [
+        {"text": text, "confidence": confidence}
+        for text, confidence in _filter_lines(results, confidence_threshold, clean)
+    ]
+
+
+def parse_lines_columnar(results: List[Tuple[str, float]],
+                         confidence_threshold: float = 0.3,
+                         clean: bool = True) -> dict:
+    """
+    OCR 결과를 줄 단위로 파싱해 열 단위로 반환합니다. (parse_lines와 같은 필터링)
     
-    for text, confidence in results:
-        # 신뢰도 필터링
-        if confidence < confidence_threshold:
-            continue
-        
-        # 텍스트 정제
-        if clean:
-            text = clean_text(text)
-        
-        # 빈 텍스트 제외
-        if not text:
-            continue
+    줄마다 dict를 만들지 않으므로 결과가 많을 때 메모리를 적게 쓰고,
+    format_output에서 텍스트를 한 번의 join으로 합칠 수 있습니다.
+    
+    Args:
+        results: OCR 결과 리스트 [(텍스트, 신뢰도), ...]
+        confidence_threshold: 최소 신뢰도 임계값
+        clean: 텍스트 정제 적용 여부
         
-        parsed.append({
-            "text": text,
-            "confidence": round(confidence, 4)
-        })
+    Returns:
+        dict: {"texts": List[str], "confidences": np.ndarray(float32)}
+            두 항목의 길이와 순서는 같습니다.
+    """
+    texts = []
+    confidences = []
+    for text, confidence in _filter_lines(results, confidence_threshold, clean):
+        texts.append(text)
+        confidences.append(confidence)
     
-    return parsed
+    return {
+        "texts": texts,
+        "confidences": np.asarray(confidences, dtype=np.float32)
+    }
 
 
-def format_output(parsed_results: List[dict], 
+def format_output(parsed_results: Union[dict, List[dict]], 
                   include_confidence: bool = False,
                   separator: str = "\n") -> str:
     """
     파싱된 결과를 문자열로 포맷팅합니다.
     
     Args:
-        parsed_results: 파싱된 OCR 결과
+        parsed_results: parse_lines의 결과 [{"text": str, "confidence": float}, ...]
+            또는 parse_lines_columnar의 결과 {"texts": [...], "confidences": [...]}
         include_confidence: 신뢰도 포함 여부
         separator: 줄 구분자
         
     Returns:
         str: 포맷팅된 텍스트
     """
-    lines = []
-    
-    for item in parsed_results:
-        if include_confidence:
-            lines.append(f"{item['text']} (신뢰도: {item['confidence']:.2%})")
-        else:
-            lines.append(item['text'])
+    if isinstance(parsed_results, dict):
+        texts = parsed_results["texts"]
+        if not include_confidence:
+            return separator.join(texts)
+        return separator.join([
+            f"{text} (신뢰도: {confidence:.2%})"
+            for text, confidence in zip(texts, np.asarray(parsed_results["confidences"]).tolist())
+        ])
     
-    return separator.join(lines)
+    # str.join은 제너레이터를 받아도 내부에서 리스트로 만들므로 리스트 컴프리헨션을 직접 전달
+    if include_confidence:
+        return separator.join([
+            f"{item['text']} (신뢰도: {item['confidence']:.2%})" for item in parsed_results
+        ])
+    return separator.join([item['text'] for item in parsed_results])
 
 
 def get_file_info(file_path: str) -> dict:
@@ -320,26 +669,32 @@ def get_file_info(file_path: str) -> dict:
     Returns:
         dict: 파일 정보
     """
-    path = Path(file_path)
-    stat = path.stat()
+    file_stat = os.stat(file_path)
     
+    ext = _file_ext(file_path)
     return {
-        "name": path.name,
-        "extension": path.suffix.lower(),
-        "size_bytes": stat.st_size,
-        "size_readable": format_file_size(stat.st_size),
-        "is_pdf": is_pdf_file(file_path),
-        "is_image": is_image_file(file_path)
+        "name": os.path.basename(file_path),
+        "extension": ext,
+        "size_bytes": file_stat.st_size,
+        "size_readable": format_file_size(file_stat.st_size),
+        "is_pdf": ext == SUPPORTED_PDF_EXTENSION,
+        "is_image": ext in SUPPORTED_IMAGE_EXTENSIONS
     }
 
 
+_FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@functools.lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
-    """파일 크기를 읽기 쉬운 형식으로 변환합니다."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    """파일 크기를 읽기 쉬운 형식으로 변환합니다. (순수 함수이므로 결과 캐시)"""
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # 단위 인덱스 = log1024(크기) - 비트 길이로 반복 나눗셈 없이 계산 (2의 거듭제곱 나눗셈이라 결과 동일)
+    unit_index = (size_bytes.bit_length() - 1) // 10
+    if unit_index > 4:  # TB 이상은 TB로 표시
+        unit_index = 4
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_FILE_SIZE_UNITS[unit_index]}"
 
 
 def save_text_to_file(text: str, output_path: str, encoding: str = 'utf-8') -> bool:
@@ -352,12 +707,15 @@ def save_text_to_file(text: str, output_path: str, encoding: str = 'utf-8') -> b
         encoding: 파일 인코딩
         
     Returns:
-        bool: 저장 성공 여부
+        bool: 저장 성공 여부 (파일 쓰기/인코딩 실패 시 False)
     """
+    # 한 번의 write로 전달 - 버퍼보다 큰 쓰기는 BufferedWriter가 그대로 OS에 넘기므로
+    # 별도 버퍼 크기 지정이 필요 없음 (텍스트 모드라 줄바꿈 변환도 유지)
     try:
         with open(output_path, 'w', encoding=encoding) as f:
             f.write(text)
         return True
-    except Exception:
+    except (OSError, UnicodeError):
+        # 그 밖의 예외(잘못된 인자 타입, 알 수 없는 인코딩 이름 등)는 호출자 버그이므로 그대로 전파
         return False
 